@@ -259,3 +259,7 @@ class UpdateEvaluatorConfig(BaseModel):
     name: Optional[str]
     evaluator_key: Optional[str]
     settings_values: Optional[dict]
+
+
+class DeleteEvaluatorConfigs(BaseModel):
+    evaluators_configs_ids: List[str]
@@ -2,8 +2,10 @@
 """
 
 import json
-from typing import List
+import asyncio
+from typing import List, Optional
 from agenta_backend.services import db_manager
+from agenta_backend.utils.dataloader import DataLoader
 from agenta_backend.models.api.user_models import User
 from agenta_backend.models.db_models import (
     AppVariantDB,
@@ -65,6 +67,17 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+class EvaluationLoaders:
+    """Loaders batching the lookups made while converting the evaluations of a request"""
+
+    def __init__(self):
+        self.variants = DataLoader(db_manager.fetch_app_variants_by_ids)
+        self.variant_revisions = DataLoader(
+            db_manager.fetch_app_variant_revisions_by_ids
+        )
+        self.evaluator_configs = DataLoader(db_manager.fetch_evaluator_configs_by_ids)
+
+
 def human_evaluation_db_to_simple_evaluation_output(
     human_evaluation_db: HumanEvaluationDB,
 ) -> SimpleEvaluationOutput:
@@ -78,19 +91,18 @@ def human_evaluation_db_to_simple_evaluation_output(
 
 
 async def evaluation_db_to_pydantic(
-    evaluation_db: EvaluationDB,
+    evaluation_db: EvaluationDB, loaders: Optional[EvaluationLoaders] = None
 ) -> Evaluation:
-    variant = await db_manager.get_app_variant_instance_by_id(
-        str(evaluation_db.variant)
+    loaders = loaders or EvaluationLoaders()
+    variant, variant_revision, aggregated_results = await asyncio.gather(
+        loaders.variants.load(str(evaluation_db.variant)),
+        loaders.variant_revisions.load(str(evaluation_db.variant_revision)),
+        aggregated_result_to_pydantic(
+            evaluation_db.aggregated_results, loaders.evaluator_configs
+        ),
     )
     variant_name = variant.variant_name if variant else str(evaluation_db.variant)
-    variant_revision = await db_manager.get_app_variant_revision_by_id(
-        str(evaluation_db.variant_revision)
-    )
     revision = str(variant_revision.revision)
-    aggregated_results = await aggregated_result_to_pydantic(
-        evaluation_db.aggregated_results
-    )
     return Evaluation(
         id=str(evaluation_db.id),
         app_id=str(evaluation_db.app.id),
@@ -116,20 +128,28 @@ async def evaluation_db_to_pydantic(
 
 
 async def human_evaluation_db_to_pydantic(
-    evaluation_db: HumanEvaluationDB,
+    evaluation_db: HumanEvaluationDB, loaders: Optional[EvaluationLoaders] = None
 ) -> HumanEvaluation:
-    variant_names = []
-    for variant_id in evaluation_db.variants:
-        variant = await db_manager.get_app_variant_instance_by_id(str(variant_id))
-        variant_name = variant.variant_name if variant else str(variant_id)
-        variant_names.append(str(variant_name))
-    revisions = []
-    for variant_revision_id in evaluation_db.variants_revisions:
-        variant_revision = await db_manager.get_app_variant_revision_by_id(
-            str(variant_revision_id)
-        )
-        revision = variant_revision.revision
-        revisions.append(str(revision))
+    loaders = loaders or EvaluationLoaders()
+    variants = await asyncio.gather(
+        *[
+            loaders.variants.load(str(variant_id))
+            for variant_id in evaluation_db.variants
+        ]
+    )
+    variant_names = [
+        str(variant.variant_name if variant else variant_id)
+        for variant, variant_id in zip(variants, evaluation_db.variants)
+    ]
+    variant_revisions = await asyncio.gather(
+        *[
+            loaders.variant_revisions.load(str(variant_revision_id))
+            for variant_revision_id in evaluation_db.variants_revisions
+        ]
+    )
+    revisions = [
+        str(variant_revision.revision) for variant_revision in variant_revisions
+    ]
 
     return HumanEvaluation(
         id=str(evaluation_db.id),
@@ -174,12 +194,21 @@ def human_evaluation_scenario_db_to_pydantic(
     )
 
 
-async def aggregated_result_to_pydantic(results: List[AggregatedResult]) -> List[dict]:
+async def aggregated_result_to_pydantic(
+    results: List[AggregatedResult],
+    evaluator_config_loader: Optional[DataLoader] = None,
+) -> List[dict]:
+    evaluator_config_loader = evaluator_config_loader or DataLoader(
+        db_manager.fetch_evaluator_configs_by_ids
+    )
+    evaluator_configs_db = await asyncio.gather(
+        *[
+            evaluator_config_loader.load(str(result.evaluator_config))
+            for result in results
+        ]
+    )
     transformed_results = []
-    for result in results:
-        evaluator_config_db = await db_manager.fetch_evaluator_config(
-            str(result.evaluator_config)
-        )
+    for result, evaluator_config_db in zip(results, evaluator_configs_db):
         evaluator_config_dict = (
             evaluator_config_db.json() if evaluator_config_db else None
         )
@@ -314,17 +343,16 @@ async def app_variant_db_and_revision_to_extended_output(
 
 
 async def environment_db_to_output(
-    environment_db: AppEnvironmentDB,
+    environment_db: AppEnvironmentDB, variant_loader: Optional[DataLoader] = None
 ) -> EnvironmentOutput:
+    variant_loader = variant_loader or DataLoader(db_manager.fetch_app_variants_by_ids)
     deployed_app_variant_id = (
         str(environment_db.deployed_app_variant)
         if environment_db.deployed_app_variant
         else None
     )
     if deployed_app_variant_id:
-        deployed_app_variant = await db_manager.get_app_variant_instance_by_id(
-            deployed_app_variant_id
-        )
+        deployed_app_variant = await variant_loader.load(deployed_app_variant_id)
         deployed_variant_name = deployed_app_variant.variant_name
         revision = deployed_app_variant.revision
     else:
@@ -333,11 +361,13 @@ async def environment_db_to_output(
 
     return EnvironmentOutput(
         name=environment_db.name,
-        app_id=str(environment_db.app.id),
+        app_id=str(environment_db.app.ref.id),
         deployed_app_variant_id=deployed_app_variant_id,
         deployed_variant_name=deployed_variant_name,
-        deployed_app_variant_revision_id=str(
-            environment_db.deployed_app_variant_revision
+        deployed_app_variant_revision_id=(
+            str(environment_db.deployed_app_variant_revision.ref.id)
+            if environment_db.deployed_app_variant_revision
+            else None
         ),
         revision=revision,
     )
@@ -353,20 +383,31 @@ async def environment_db_and_revision_to_extended_output(
         else None
     )
     if deployed_app_variant_id:
-        deployed_app_variant = await db_manager.get_app_variant_instance_by_id(
+        deployed_app_variant = await db_manager.fetch_app_variant_by_id(
             deployed_app_variant_id
         )
         deployed_variant_name = deployed_app_variant.variant_name
     else:
         deployed_variant_name = None
 
+    # the users who modified the revisions, in a single query
+    users_db = await db_manager.get_users_by_ids(
+        list(
+            {
+                revision_db.modified_by.ref.id
+                for revision_db in app_environment_revisions_db
+            }
+        )
+    )
+    usernames = {user_db.id: user_db.username for user_db in users_db}
+
     app_environment_revisions = []
     for app_environment_revision in app_environment_revisions_db:
         app_environment_revisions.append(
             EnvironmentRevision(
                 id=str(app_environment_revision.id),
                 revision=app_environment_revision.revision,
-                modified_by=app_environment_revision.modified_by.username,
+                modified_by=usernames.get(app_environment_revision.modified_by.ref.id),
                 deployed_app_variant_revision=str(
                     app_environment_revision.deployed_app_variant_revision
                 ),
@@ -376,11 +417,11 @@ async def environment_db_and_revision_to_extended_output(
         )
     return EnvironmentOutputExtended(
         name=environment_db.name,
-        app_id=str(environment_db.app.id),
+        app_id=str(environment_db.app.ref.id),
         deployed_app_variant_id=deployed_app_variant_id,
         deployed_variant_name=deployed_variant_name,
         deployed_app_variant_revision_id=str(
-            environment_db.deployed_app_variant_revision.id
+            environment_db.deployed_app_variant_revision.ref.id
         ),
         revision=environment_db.revision,
         revisions=app_environment_revisions,
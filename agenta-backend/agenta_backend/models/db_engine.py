@@ -1,6 +1,8 @@
 import os
+import asyncio
 import logging
 from typing import List
+from weakref import WeakKeyDictionary
 
 from pymongo import MongoClient
 from beanie import init_beanie, Document
@@ -57,6 +59,12 @@ document_models: List[Document] = [
     TraceDB,
 ]
 
+# Motor clients are bound to the event loop they were created on, so a single
+# client is kept per loop and shared by every initialization made on it
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncIOMotorClient]" = (
+    WeakKeyDictionary()
+)
+
 
 class DBEngine:
     """
@@ -68,16 +76,39 @@ class DBEngine:
         self.db_url = os.environ["MONGODB_URI"]
 
     async def initialize_client(self):
-        return AsyncIOMotorClient(self.db_url)
+        # every process (the API and each celery worker) holds its own pool, so the
+        # pools are kept small to not over-subscribe the server
+        client_options = dict(
+            maxPoolSize=int(os.environ.get("MONGODB_MAX_POOL_SIZE", 20)),
+            minPoolSize=int(os.environ.get("MONGODB_MIN_POOL_SIZE", 5)),
+            maxIdleTimeMS=int(os.environ.get("MONGODB_MAX_IDLE_TIME_MS", 30_000)),
+            serverSelectionTimeoutMS=int(
+                os.environ.get("MONGODB_SERVER_SELECTION_TIMEOUT_MS", 5_000)
+            ),
+            retryWrites=True,
+        )
+        # wire compression is opt-in, as zstd and snappy need extra packages
+        compressors = os.environ.get("MONGODB_COMPRESSORS")
+        if compressors:
+            client_options["compressors"] = compressors
+        return AsyncIOMotorClient(self.db_url, **client_options)
 
     async def init_db(self):
         """
         Initialize Beanie based on the mode and store the engine.
+
+        Beanie is only initialized once per event loop; later calls on the same loop
+        reuse its client and connection pool.
         """
 
+        loop = asyncio.get_running_loop()
+        if loop in _clients:
+            return
+
         client = await self.initialize_client()
         db_name = self._get_database_name(self.mode)
         await init_beanie(database=client[db_name], document_models=document_models)
+        _clients[loop] = client
         logger.info(f"Using {db_name} database...")
 
     def _get_database_name(self, mode: str) -> str:
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from beanie import Document, Link, PydanticObjectId
 
 
@@ -52,6 +53,10 @@ class UserDB(Document):
 
     class Settings:
         name = "users"
+        indexes = [
+            IndexModel([("uid", ASCENDING)]),
+            IndexModel([("email", ASCENDING)]),
+        ]
 
 
 class ImageDB(Document):
@@ -139,6 +144,32 @@ class AppVariantDB(Document):
 
     class Settings:
         name = "app_variants"
+        indexes = [
+            IndexModel([("base.$id", ASCENDING), ("config_name", ASCENDING)]),
+            IndexModel([("app.$id", ASCENDING), ("variant_name", ASCENDING)]),
+            IndexModel([("organization.$id", ASCENDING), ("base.$id", ASCENDING)]),
+            IndexModel([("user.$id", ASCENDING), ("app.$id", ASCENDING)]),
+        ]
+
+
+class AppVariantConfigNameView(BaseModel):
+    """Projection of an app variant to its id and config name"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    config_name: Optional[str]
+
+
+class OrganizationLinkView(BaseModel):
+    """Projection of a document to its id and organization link"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    organization: Link[OrganizationDB]
+
+
+class AppVariantImageView(BaseModel):
+    """Projection of an app variant to its image link"""
+
+    image: Link[ImageDB]
 
 
 class AppVariantRevisionsDB(Document):
@@ -152,6 +183,9 @@ class AppVariantRevisionsDB(Document):
 
     class Settings:
         name = "app_variant_revisions"
+        indexes = [
+            IndexModel([("variant.$id", ASCENDING), ("revision", DESCENDING)]),
+        ]
 
 
 class AppEnvironmentDB(Document):
@@ -167,6 +201,9 @@ class AppEnvironmentDB(Document):
 
     class Settings:
         name = "environments"
+        indexes = [
+            IndexModel([("app.$id", ASCENDING), ("name", ASCENDING)]),
+        ]
 
 
 class AppEnvironmentRevisionDB(Document):
@@ -179,6 +216,9 @@ class AppEnvironmentRevisionDB(Document):
 
     class Settings:
         name = "environments_revisions"
+        indexes = [
+            IndexModel([("environment.$id", ASCENDING), ("revision", DESCENDING)]),
+        ]
 
 
 class TemplateDB(Document):
@@ -197,6 +237,15 @@ class TemplateDB(Document):
         name = "templates"
 
 
+class TemplateView(BaseModel):
+    """Projection of a template to the fields compared when syncing templates"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    description: str
+    template_uri: Optional[str]
+
+
 class TestSetDB(Document):
     name: str
     app: Link[AppDB]
@@ -208,6 +257,25 @@ class TestSetDB(Document):
 
     class Settings:
         name = "testsets"
+        indexes = [
+            # covers the listing of an app's testsets through TestSetView
+            IndexModel(
+                [
+                    ("app.$id", ASCENDING),
+                    ("name", ASCENDING),
+                    ("created_at", ASCENDING),
+                    ("_id", ASCENDING),
+                ]
+            ),
+        ]
+
+
+class TestSetView(BaseModel):
+    """Projection of a testset to the fields listed without its rows"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    created_at: Optional[datetime]
 
 
 class EvaluatorConfigDB(Document):
@@ -222,6 +290,17 @@ class EvaluatorConfigDB(Document):
 
     class Settings:
         name = "evaluators_configs"
+        indexes = [
+            IndexModel([("app.$id", ASCENDING), ("evaluator_key", ASCENDING)]),
+        ]
+
+
+class EvaluatorConfigView(BaseModel):
+    """Projection of an evaluator config to the fields needed to run its evaluator"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    evaluator_key: str
+    settings_values: Dict[str, Any] = Field(default=dict)
 
 
 class Error(BaseModel):
@@ -283,6 +362,9 @@ class HumanEvaluationDB(Document):
 
     class Settings:
         name = "human_evaluations"
+        indexes = [
+            IndexModel([("app.$id", ASCENDING)]),
+        ]
 
 
 class HumanEvaluationScenarioDB(Document):
@@ -301,6 +383,9 @@ class HumanEvaluationScenarioDB(Document):
 
     class Settings:
         name = "human_evaluations_scenarios"
+        indexes = [
+            IndexModel([("evaluation.$id", ASCENDING)]),
+        ]
 
 
 class EvaluationDB(Document):
@@ -318,6 +403,9 @@ class EvaluationDB(Document):
 
     class Settings:
         name = "new_evaluations"
+        indexes = [
+            IndexModel([("app.$id", ASCENDING)]),
+        ]
 
 
 class EvaluationScenarioDB(Document):
@@ -337,6 +425,12 @@ class EvaluationScenarioDB(Document):
 
     class Settings:
         name = "new_evaluation_scenarios"
+        indexes = [
+            # the result types also serve the lookup of the failed scenarios
+            IndexModel(
+                [("evaluation.$id", ASCENDING), ("results.result.type", ASCENDING)]
+            ),
+        ]
 
 
 class SpanDB(Document):
@@ -1,10 +1,11 @@
 import os
+import asyncio
 import logging
 from docker.errors import DockerException
 from fastapi.responses import JSONResponse
 from agenta_backend.config import settings
 from typing import List, Optional
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Query, Request
 from agenta_backend.utils.common import APIRouter
 from agenta_backend.services.selectors import get_user_own_org
 from agenta_backend.services import (
@@ -28,6 +29,7 @@ from agenta_backend.models.api.api_models import (
     EnvironmentOutputExtended,
 )
 from agenta_backend.models import converters
+from agenta_backend.utils.dataloader import DataLoader
 
 if os.environ["FEATURE_FLAG"] in ["cloud", "ee"]:
     from agenta_backend.commons.services.selectors import (
@@ -51,6 +53,12 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Largest page the list endpoints return when a limit is requested
+MAX_PAGE_SIZE = 1000
+
+# Revision histories grow without bound, so they are always returned a page at a time
+DEFAULT_REVISIONS_PAGE_SIZE = 50
+
 
 @router.get(
     "/{app_id}/variants/",
@@ -60,12 +68,16 @@ logger.setLevel(logging.DEBUG)
 async def list_app_variants(
     app_id: str,
     request: Request,
+    last_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
 ):
     """
     Retrieve a list of app variants for a given app ID.
 
     Args:
         app_id (str): The ID of the app to retrieve variants for.
+        last_id (Optional[str]): Lists the variants after the variant with this ID, to fetch the next page.
+        limit (Optional[int]): The maximum number of variants to return.
         stoken_session (SessionContainer, optional): The session container to verify the user's session. Defaults to Depends(verify_session()).
 
     Returns:
@@ -86,7 +98,11 @@ async def list_app_variants(
             )
 
         app_variants = await db_manager.list_app_variants(
-            app_id=app_id, **user_org_data
+            app_id=app_id,
+            fetch_links=True,
+            last_id=last_id,
+            limit=limit,
+            **user_org_data,
         )
         return [
             await converters.app_variant_db_to_output(app_variant)
@@ -150,6 +166,8 @@ async def list_apps(
     request: Request,
     app_name: Optional[str] = None,
     org_id: Optional[str] = None,
+    last_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
 ) -> List[App]:
     """
     Retrieve a list of apps filtered by app_name and org_id.
@@ -157,6 +175,8 @@ async def list_apps(
     Args:
         app_name (Optional[str]): The name of the app to filter by.
         org_id (Optional[str]): The ID of the organization to filter by.
+        last_id (Optional[str]): Lists the apps after the app with this ID, to fetch the next page.
+        limit (Optional[int]): The maximum number of apps to return.
         stoken_session (SessionContainer): The session container.
 
     Returns:
@@ -167,7 +187,9 @@ async def list_apps(
     """
     try:
         user_org_data: dict = await get_user_and_org_id(request.state.user_id)
-        apps = await db_manager.list_apps(app_name, org_id, **user_org_data)
+        apps = await db_manager.list_apps(
+            app_name, org_id, last_id=last_id, limit=limit, **user_org_data
+        )
         return apps
     except Exception as e:
         logger.exception(f"An error occurred: {str(e)}")
@@ -219,7 +241,7 @@ async def add_variant_from_image(
                 {"detail": error_msg},
                 status_code=403,
             )
-        app = await db_manager.fetch_app_by_id(app_id)
+        app = await db_manager.fetch_app_by_id(app_id, fetch_links=True)
 
         variant_db = await app_manager.add_variant_based_on_image(
             app=app,
@@ -231,7 +253,9 @@ async def add_variant_from_image(
             is_template_image=False,
             **user_org_data,
         )
-        app_variant_db = await db_manager.fetch_app_variant_by_id(str(variant_db.id))
+        app_variant_db = await db_manager.fetch_app_variant_by_id(
+            str(variant_db.id), fetch_links=True
+        )
 
         logger.debug("Step 8: We create ready-to use evaluators")
         await evaluator_manager.create_ready_to_use_evaluators(app=app)
@@ -427,10 +451,15 @@ async def list_environments(
                 app_id=app_id, **user_and_org_data
             )
             logger.debug(f"environments_db: {environments_db}")
-            return [
-                await converters.environment_db_to_output(env)
-                for env in environments_db
-            ]
+            # convert the environments concurrently so that their deployed variants
+            # are loaded in a single query
+            variant_loader = DataLoader(db_manager.fetch_app_variants_by_ids)
+            return await asyncio.gather(
+                *[
+                    converters.environment_db_to_output(env, variant_loader)
+                    for env in environments_db
+                ]
+            )
     except Exception as e:
         logger.exception(f"An error occurred: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -442,8 +471,24 @@ async def list_environments(
     response_model=EnvironmentOutputExtended,
 )
 async def list_app_environment_revisions(
-    request: Request, app_id: str, environment_name
+    request: Request,
+    app_id: str,
+    environment_name,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_REVISIONS_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
 ):
+    """
+    Retrieve an app environment with its revisions, most recent first.
+
+    Args:
+        app_id (str): The ID of the app of the environment.
+        environment_name (str): The name of the environment.
+        skip (int): The number of most recent revisions to skip, to fetch the next page.
+        limit (int): The maximum number of revisions to return.
+
+    Returns:
+        EnvironmentOutputExtended: The environment and the requested page of its revisions.
+    """
     logger.debug("getting environment " + environment_name)
     user_org_data: dict = await get_user_and_org_id(request.state.user_id)
     try:
@@ -470,7 +515,7 @@ async def list_app_environment_revisions(
 
         app_environment_revisions = (
             await db_manager.fetch_environment_revisions_for_environment(
-                app_environment, **user_org_data
+                app_environment, skip=skip, limit=limit, **user_org_data
             )
         )
         if app_environment_revisions is None:
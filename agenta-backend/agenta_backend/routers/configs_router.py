@@ -1,6 +1,12 @@
 import os
-from typing import Optional
-from fastapi import Request, HTTPException
+import asyncio
+import orjson
+from weakref import WeakValueDictionary
+from typing import Iterator, List, Optional, Union
+from cachetools import TTLCache
+from fastapi import Depends, Query, Request, HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from agenta_backend.utils import redis_utils
 from agenta_backend.utils.common import APIRouter
 import logging
 
@@ -8,10 +14,7 @@ from agenta_backend.models.api.api_models import (
     SaveConfigPayload,
     GetConfigResponse,
 )
-from agenta_backend.services import (
-    db_manager,
-    app_manager,
-)
+from agenta_backend.services import db_manager
 
 if os.environ["FEATURE_FLAG"] in ["cloud", "ee"]:
     from agenta_backend.commons.services.selectors import (
@@ -22,50 +25,131 @@ else:
 
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO)
 
 router = APIRouter()
 
+# Time to live of cached deployment revision configs
+DEPLOYMENT_REVISION_CACHE_TTL_SECONDS = 60
+
+# Deployment revisions never change, so their configs are also kept in process
+_deployment_revision_configs = TTLCache(maxsize=10_000, ttl=600)
+# a revision's lock lives as long as a request holds or waits on it
+_deployment_revision_locks: "WeakValueDictionary[str, asyncio.Lock]" = (
+    WeakValueDictionary()
+)
+
+# Config responses whose parameters are larger than this are streamed
+STREAMING_PARAMETERS_THRESHOLD_BYTES = 256 * 1024
+
+
+async def get_user_org_data(request: Request) -> dict:
+    """Resolves the user and organization data of the request, caching it on the
+    request state so it is only looked up once per request.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        dict: The user and organization data.
+    """
+
+    user_org_data = getattr(request.state, "user_org_data", None)
+    if user_org_data is None:
+        user_org_data = await get_user_and_org_id(request.state.user_id)
+        request.state.user_org_data = user_org_data
+    return user_org_data
+
+
+def _iter_config_json_chunks(
+    config_head: bytes, parameters_fragments: List[bytes]
+) -> Iterator[bytes]:
+    """Yields a config JSON document chunk by chunk, one parameter at a time.
+
+    Args:
+        config_head (bytes): The serialized config without its parameters.
+        parameters_fragments (List[bytes]): The serialized `"key":value` parameter pairs.
+    """
+
+    yield config_head[:-1] + b',"parameters":{'
+    for index, fragment in enumerate(parameters_fragments):
+        yield fragment if index == 0 else b"," + fragment
+    yield b"}}"
+
+
+def config_json_response(config: GetConfigResponse) -> Response:
+    """Serializes a config response with orjson, streaming it when its parameters
+    are large so that the whole document is never joined in memory.
+
+    Args:
+        config (GetConfigResponse): The config to send.
+
+    Returns:
+        Response: a JSON response, or a streaming one for large parameters.
+    """
+
+    config_head = orjson.dumps(config.dict(exclude={"parameters"}))
+    parameters_fragments = [
+        orjson.dumps(key) + b":" + orjson.dumps(value)
+        for key, value in config.parameters.items()
+    ]
+    chunks = _iter_config_json_chunks(config_head, parameters_fragments)
+    parameters_size = sum(len(fragment) for fragment in parameters_fragments)
+    if parameters_size > STREAMING_PARAMETERS_THRESHOLD_BYTES:
+        return StreamingResponse(chunks, media_type="application/json")
+    return Response(content=b"".join(chunks), media_type="application/json")
+
 
 @router.post("/", operation_id="save_config")
 async def save_config(
     payload: SaveConfigPayload,
-    request: Request,
+    user_org_data: dict = Depends(get_user_org_data),
 ):
     try:
-        user_org_data: dict = await get_user_and_org_id(request.state.user_id)
         base_db = await db_manager.fetch_base_and_check_access(
             payload.base_id, user_org_data
         )
-        variants_db = await db_manager.list_variants_for_base(base_db, **user_org_data)
-        variant_to_overwrite = None
-        for variant_db in variants_db:
-            if variant_db.config_name == payload.config_name:
-                variant_to_overwrite = variant_db
-                break
-        if variant_to_overwrite is not None:
-            if payload.overwrite or variant_to_overwrite.config.parameters == {}:
-                print(f"update_variant_parameters  ===> {payload.overwrite}")
-                await app_manager.update_variant_parameters(
-                    app_variant_id=str(variant_to_overwrite.id),
-                    parameters=payload.parameters,
-                    **user_org_data,
+        # serialize concurrent saves of the same config, across workers, so they
+        # cannot both take the add path and create duplicate variants
+        async with redis_utils.redis_lock(
+            f"save_config:{payload.base_id}:{payload.config_name}"
+        ):
+            variant_to_overwrite = (
+                await db_manager.fetch_variant_by_base_and_config_name(
+                    payload.base_id, payload.config_name
                 )
+            )
+            if variant_to_overwrite is not None:
+                if payload.overwrite or variant_to_overwrite.config.parameters == {}:
+                    if variant_to_overwrite.config.parameters == payload.parameters:
+                        # nothing changed, skip creating a new revision
+                        return
+                    logger.debug("update_variant_parameters ===> %s", payload.overwrite)
+                    # the variant was already fetched for this base, so update it
+                    # directly rather than re-fetching it by id
+                    await db_manager.update_variant_parameters(
+                        app_variant_db=variant_to_overwrite,
+                        parameters=payload.parameters,
+                        **user_org_data,
+                    )
+                else:
+                    return JSONResponse(
+                        status_code=409,
+                        content={
+                            "detail": "Config name already exists. Please use a different name or set overwrite to True."
+                        },
+                    )
             else:
-                raise HTTPException(
-                    status_code=200,
-                    detail="Config name already exists. Please use a different name or set overwrite to True.",
+                logger.debug(
+                    "add_variant_from_base_and_config overwrite ===> %s",
+                    payload.overwrite,
+                )
+                await db_manager.add_variant_from_base_and_config(
+                    base_db=base_db,
+                    new_config_name=payload.config_name,
+                    parameters=payload.parameters,
+                    **user_org_data,
                 )
-        else:
-            print(
-                f"add_variant_from_base_and_config overwrite ===> {payload.overwrite}"
-            )
-            await db_manager.add_variant_from_base_and_config(
-                base_db=base_db,
-                new_config_name=payload.config_name,
-                parameters=payload.parameters,
-                **user_org_data,
-            )
     except HTTPException as e:
         logger.error(f"save_config http exception ===> {e.detail}")
         raise
@@ -76,63 +160,67 @@ async def save_config(
 
 @router.get("/", response_model=GetConfigResponse, operation_id="get_config")
 async def get_config(
-    request: Request,
     base_id: str,
     config_name: Optional[str] = None,
     environment_name: Optional[str] = None,
+    user_org_data: dict = Depends(get_user_org_data),
 ):
     try:
+        if not environment_name and not config_name:
+            raise HTTPException(
+                status_code=400,
+                detail="Either config_name or environment_name must be provided",
+            )
+
         # detemine whether the user has access to the base
-        user_org_data: dict = await get_user_and_org_id(request.state.user_id)
         base_db = await db_manager.fetch_base_and_check_access(base_id, user_org_data)
         # in case environment_name is provided, find the variant deployed
         if environment_name:
-            app_environments = await db_manager.list_environments(
-                app_id=str(base_db.app.id)
+            app_environment = await db_manager.fetch_app_environment_by_name_and_appid(
+                str(base_db.app.ref.id), environment_name
             )
-            found_variant = None
-            for app_environment in app_environments:
-                if app_environment.name == environment_name:
-                    found_variant_revision = (
-                        app_environment.deployed_app_variant_revision
-                    )
-                    break
-            if not found_variant_revision:
+            if app_environment is None:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Environment name {environment_name} not found for base {base_id}",
                 )
-            if str(found_variant_revision.base.id) != base_id:
+            found_variant_revision = (
+                await db_manager.fetch_app_variant_revision_by_id(
+                    str(app_environment.deployed_app_variant_revision.ref.id)
+                )
+                if app_environment.deployed_app_variant_revision
+                else None
+            )
+            if not found_variant_revision:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"No variant is deployed to environment {environment_name} for base {base_id}",
+                )
+            if str(found_variant_revision.base.ref.id) != base_id:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Environment {environment_name} does not deploy base {base_id}",
                 )
             config = found_variant_revision.config
         elif config_name:
-            variants_db = await db_manager.list_variants_for_base(
-                base_db, **user_org_data
+            found_variant = await db_manager.fetch_variant_by_base_and_config_name(
+                base_id, config_name
             )
-            found_variant = None
-            for variant_db in variants_db:
-                if variant_db.config_name == config_name:
-                    found_variant = variant_db
-                    break
             if not found_variant:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Config name {config_name} not found for base {base_id}",
                 )
             config = found_variant.config
-        logger.debug(config.parameters)
-        return GetConfigResponse(
-            config_id=str(
-                0
-            ),  # TODO: Remove from the model and regenerate the SDK client
-            config_name=config.config_name,
-            current_version=str(
-                0
-            ),  # TODO: remove from teh model and regenerate the SDK client
-            parameters=config.parameters,
+        logger.debug("config parameters: %s", config.parameters)
+        return config_json_response(
+            # the config comes from the database, so skip re-validating it
+            GetConfigResponse.construct(
+                config_id="0",  # TODO: Remove from the model and regenerate the SDK client
+                config_name=config.config_name,
+                current_version=0,  # TODO: remove from teh model and regenerate the SDK client
+                parameters=config.parameters,
+            )
         )
     except HTTPException as e:
         logger.error(f"get_config http exception: {e.detail}")
@@ -142,31 +230,120 @@ async def get_config(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get(
+    "/batch/",
+    response_model=List[GetConfigResponse],
+    operation_id="get_configs_batch",
+)
+async def get_configs_batch(
+    base_id: str,
+    config_names: List[str] = Query(...),
+    user_org_data: dict = Depends(get_user_org_data),
+):
+    try:
+        await db_manager.fetch_base_and_check_access(base_id, user_org_data)
+        found_variants = await db_manager.fetch_variants_by_base_and_config_names(
+            base_id, config_names
+        )
+        configs_by_name = {
+            variant.config_name: variant.config for variant in found_variants
+        }
+        missing_names = [name for name in config_names if name not in configs_by_name]
+        if missing_names:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Config names {', '.join(missing_names)} not found for base {base_id}",
+            )
+        return [
+            GetConfigResponse.construct(
+                config_id="0",
+                config_name=configs_by_name[name].config_name,
+                current_version=0,
+                parameters=configs_by_name[name].parameters,
+            )
+            for name in config_names
+        ]
+    except HTTPException as e:
+        logger.error(f"get_configs_batch http exception: {e.detail}")
+        raise
+    except Exception as e:
+        logger.error(f"get_configs_batch exception: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get(
     "/deployment/{deployment_revision_id}/",
     operation_id="get_config_deployment_revision",
 )
 async def get_config_deployment_revision(request: Request, deployment_revision_id: str):
-    environment_revision = await db_manager.fetch_app_environment_revision(
-        deployment_revision_id
-    )
+    # deployment revisions never change, so the id alone identifies the response
+    etag = f'"{deployment_revision_id}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=31536000, immutable"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    config_json = _deployment_revision_configs.get(deployment_revision_id)
+    if config_json is None:
+        # only one request per revision loads it, concurrent ones wait for it
+        lock = _deployment_revision_locks.get(deployment_revision_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            _deployment_revision_locks[deployment_revision_id] = lock
+        async with lock:
+            config_json = _deployment_revision_configs.get(deployment_revision_id)
+            if config_json is None:
+                config_json = await _load_deployment_revision_config_json(
+                    deployment_revision_id
+                )
+                _deployment_revision_configs[deployment_revision_id] = config_json
+    return Response(content=config_json, media_type="application/json", headers=headers)
+
+
+async def _load_deployment_revision_config_json(
+    deployment_revision_id: str,
+) -> Union[str, bytes]:
+    """Loads the serialized config of a deployment revision, from Redis when it
+    is cached there and from the database otherwise.
+
+    Args:
+        deployment_revision_id (str): The ID of the environment revision.
+
+    Returns:
+        Union[str, bytes]: The config, serialized as JSON.
+    """
+
+    cache_key = f"deployment_revision_config:{deployment_revision_id}"
+    cached_config = await redis_utils.get_cached_response(cache_key)
+    if cached_config is not None:
+        return cached_config
+
+    (
+        environment_revision,
+        variant_revision,
+    ) = await db_manager.fetch_environment_revision_with_variant(deployment_revision_id)
     if environment_revision is None:
         raise HTTPException(
             404, f"No environment revision found for {deployment_revision_id}"
         )
-
-    variant_revision = await db_manager.fetch_app_variant_revision_by_id(
-        str(environment_revision.deployed_app_variant_revision)
-    )
     if not variant_revision:
         raise HTTPException(
             404,
             f"No configuration found for deployment revision {deployment_revision_id}",
         )
-    return GetConfigResponse(
-        **variant_revision.config.dict(),
+    config = GetConfigResponse.construct(
+        config_id=None,
+        config_name=variant_revision.config.config_name,
         current_version=environment_revision.revision,
+        parameters=variant_revision.config.parameters,
+    )
+    config_json = config.json()
+    await redis_utils.set_cached_response(
+        cache_key,
+        config_json,
+        ttl_seconds=DEPLOYMENT_REVISION_CACHE_TTL_SECONDS,
     )
+    return config_json
 
 
 @router.post(
@@ -190,7 +367,7 @@ async def revert_deployment_revision(request: Request, deployment_revision_id: s
         )
 
     await db_manager.update_app_environment_deployed_variant_revision(
-        environment_revision.environment,
+        str(environment_revision.environment.ref.id),
         environment_revision.deployed_app_variant_revision,
     )
     return "Environment was reverted to deployment revision successful"
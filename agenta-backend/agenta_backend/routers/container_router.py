@@ -27,6 +27,7 @@ from agenta_backend.models.api.api_models import (
     Template,
 )
 from agenta_backend.services import db_manager
+from agenta_backend.models.db_models import AppDB, AppVariantDB
 from agenta_backend.utils.common import APIRouter
 
 
@@ -64,6 +65,7 @@ async def build_image(
     app_db = await db_manager.fetch_app_and_check_access(
         app_id=app_id, user_org_data=user_org_data
     )
+    await app_db.fetch_link(AppDB.organization)
 
     image_result = await container_manager.build_image(
         app_db=app_db,
@@ -90,6 +92,7 @@ async def restart_docker_container(
     app_variant_db = await db_manager.fetch_app_variant_and_check_access(
         app_variant_id=payload.variant_id, user_org_data=user_org_data
     )
+    await app_variant_db.fetch_link(AppVariantDB.base)
     try:
         deployment = await db_manager.get_deployment_by_objectid(
             app_variant_db.base.deployment
@@ -164,6 +167,7 @@ async def construct_app_container_url(
         variant_db = await db_manager.fetch_app_variant_and_check_access(
             app_variant_id=variant_id, user_org_data=user_org_data
         )
+        await variant_db.fetch_link(AppVariantDB.base)
         deployment = await db_manager.get_deployment_by_objectid(
             variant_db.base.deployment
         )
@@ -1,16 +1,16 @@
-import os
 import json
 from typing import List
 import logging
 
 from fastapi import HTTPException, APIRouter, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 
 from agenta_backend.models.api.evaluation_model import (
     Evaluator,
     EvaluatorConfig,
     NewEvaluatorConfig,
     UpdateEvaluatorConfig,
+    DeleteEvaluatorConfigs,
 )
 
 from agenta_backend.services import (
@@ -21,14 +21,7 @@ from agenta_backend.services import evaluator_manager
 
 from agenta_backend.utils.common import check_access_to_app
 
-if os.environ["FEATURE_FLAG"] in ["cloud", "ee"]:
-    from agenta_backend.commons.services.selectors import (  # noqa pylint: disable-all
-        get_user_and_org_id,
-    )
-else:
-    from agenta_backend.services.selectors import get_user_and_org_id
-
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +42,10 @@ async def get_evaluators_endpoint():
     if not evaluators:
         raise HTTPException(status_code=404, detail="No evaluators found")
 
-    return evaluators
+    return Response(
+        content=evaluator_manager.get_evaluators_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/configs/", response_model=List[EvaluatorConfig])
@@ -64,7 +60,9 @@ async def get_evaluator_configs(app_id: str):
     """
 
     evaluators_configs = await evaluator_manager.get_evaluators_configs(app_id)
-    return evaluators_configs
+    return ORJSONResponse(
+        content=[evaluator_config.dict() for evaluator_config in evaluators_configs]
+    )
 
 
 @router.get("/configs/{evaluator_config_id}/", response_model=EvaluatorConfig)
@@ -119,6 +117,28 @@ async def update_evaluator_config(
     return evaluators_configs
 
 
+@router.delete("/configs/", response_model=int)
+async def delete_evaluator_configs(payload: DeleteEvaluatorConfigs):
+    """Endpoint to delete several evaluator configurations in one request.
+
+    Args:
+        payload (DeleteEvaluatorConfigs): The unique identifiers of the evaluator configurations.
+
+    Returns:
+        int: The number of deleted evaluator configurations.
+    """
+    try:
+        deleted_count = await evaluator_manager.delete_evaluator_configs(
+            payload.evaluators_configs_ids
+        )
+        return deleted_count
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error deleting evaluator configurations: {str(e)}",
+        )
+
+
 @router.delete("/configs/{evaluator_config_id}/", response_model=bool)
 async def delete_evaluator_config(evaluator_config_id: str):
     """Endpoint to delete a specific evaluator configuration.
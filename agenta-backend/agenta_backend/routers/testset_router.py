@@ -18,7 +18,7 @@ from agenta_backend.models.api.testset_model import (
     TestSetOutputResponse,
 )
 from agenta_backend.services import db_manager
-from agenta_backend.models.db_models import TestSetDB
+from agenta_backend.models.db_models import TestSetDB, TestSetView
 from agenta_backend.services.db_manager import get_user
 from agenta_backend.models.converters import testset_db_to_pydantic
 from agenta_backend.utils.common import APIRouter, check_access_to_app
@@ -278,10 +278,10 @@ async def update_testset(
     if test_set is None:
         raise HTTPException(status_code=404, detail="testset not found")
     access_app = await check_access_to_app(
-        user_org_data=user_org_data, app_id=str(test_set.app.id), check_owner=False
+        user_org_data=user_org_data, app_id=str(test_set.app.ref.id), check_owner=False
     )
     if not access_app:
-        error_msg = f"You do not have access to this app: {test_set.app.id}"
+        error_msg = f"You do not have access to this app: {test_set.app.ref.id}"
         return JSONResponse(
             {"detail": error_msg},
             status_code=400,
@@ -330,7 +330,7 @@ async def get_testsets(
     if app is None:
         raise HTTPException(status_code=404, detail="App not found")
 
-    testsets: List[TestSetDB] = await db_manager.fetch_testsets_by_app_id(app_id=app_id)
+    testsets: List[TestSetView] = await db_manager.list_testsets(app_id=app_id)
     return [
         TestSetOutputResponse(
             id=str(testset.id),
@@ -360,7 +360,7 @@ async def get_single_testset(
     if test_set is None:
         raise HTTPException(status_code=404, detail="testset not found")
     access_app = await check_access_to_app(
-        user_org_data=user_org_data, app_id=str(test_set.app.id), check_owner=False
+        user_org_data=user_org_data, app_id=str(test_set.app.ref.id), check_owner=False
     )
     if not access_app:
         error_msg = "You do not have access to this test set"
@@ -395,7 +395,7 @@ async def delete_testsets(
             raise HTTPException(status_code=404, detail="testset not found")
         access_app = await check_access_to_app(
             user_org_data=user_org_data,
-            app_id=str(test_set.app.id),
+            app_id=str(test_set.app.ref.id),
             check_owner=False,
         )
         if not access_app:
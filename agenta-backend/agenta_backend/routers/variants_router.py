@@ -214,7 +214,7 @@ async def update_variant_image(
                 status_code=400,
             )
         db_app_variant = await db_manager.fetch_app_variant_by_id(
-            app_variant_id=variant_id
+            app_variant_id=variant_id, fetch_links=True
         )
 
         await app_manager.update_variant_image(db_app_variant, image, **user_org_data)
@@ -275,7 +275,9 @@ async def start_variant(
             {"detail": error_msg},
             status_code=400,
         )
-    app_variant_db = await db_manager.fetch_app_variant_by_id(app_variant_id=variant_id)
+    app_variant_db = await db_manager.fetch_app_variant_by_id(
+        app_variant_id=variant_id, fetch_links=True
+    )
     if action.action == VariantActionEnum.START:
         url: URI = await app_manager.start_variant(
             app_variant_db, envvars, **user_org_data
@@ -308,7 +310,7 @@ async def get_variant(
                 status_code=400,
             )
         app_variant = await db_manager.fetch_app_variant_by_id(
-            app_variant_id=variant_id
+            app_variant_id=variant_id, fetch_links=True
         )
         app_variant_revisions = await db_manager.list_app_variant_revisions_by_variant(
             app_variant=app_variant
@@ -180,7 +180,9 @@ async def terminate_and_remove_app_variant(
 
     logger.debug(f"Removing app variant {app_variant_id}")
     if app_variant_id:
-        app_variant_db = await db_manager.fetch_app_variant_by_id(app_variant_id)
+        app_variant_db = await db_manager.fetch_app_variant_by_id(
+            app_variant_id, fetch_links=True
+        )
 
     logger.debug(f"Fetched app variant {app_variant_db}")
     app_id = app_variant_db.app.id
@@ -302,7 +304,9 @@ async def remove_app(app_id: str, **kwargs: dict):
         logger.error(error_msg)
         raise ValueError(error_msg)
     try:
-        app_variants = await db_manager.list_app_variants(app_id=app_id, **kwargs)
+        app_variants = await db_manager.list_app_variants(
+            app_id=app_id, fetch_links=True, **kwargs
+        )
         for app_variant_db in app_variants:
             await terminate_and_remove_app_variant(
                 app_variant_db=app_variant_db, **kwargs
@@ -343,7 +347,7 @@ async def update_variant_parameters(
         )
     except Exception as e:
         logger.error(
-            f"Error updating app variant {app_variant_db.app.app_name}/{app_variant_db.variant_name}"
+            f"Error updating app variant {app_variant_db.variant_name} of app {app_variant_db.app.ref.id}"
         )
         raise e from None
 
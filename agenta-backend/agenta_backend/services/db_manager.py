@@ -1,9 +1,9 @@
 import os
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
-from urllib.parse import urlparse
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from agenta_backend.models.api.api_models import (
     App,
@@ -25,12 +25,15 @@ from agenta_backend.models.db_models import (
     AggregatedResult,
     AppDB,
     AppVariantDB,
+    AppVariantConfigNameView,
+    AppVariantImageView,
     AppVariantRevisionsDB,
     ConfigDB,
     EvaluationScenarioInputDB,
     EvaluationScenarioOutputDB,
     EvaluationScenarioResult,
     EvaluatorConfigDB,
+    EvaluatorConfigView,
     VariantBaseDB,
     AppEnvironmentDB,
     EvaluationDB,
@@ -40,17 +43,23 @@ from agenta_backend.models.db_models import (
     DeploymentDB,
     AppEnvironmentRevisionDB,
     TemplateDB,
+    TemplateView,
     TestSetDB,
+    TestSetView,
     UserDB,
 )
-from agenta_backend.utils.common import check_user_org_access
+from agenta_backend.utils.common import async_ttl_cache, check_user_org_access
 from agenta_backend.models.api.evaluation_model import EvaluationStatusEnum
 
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
-from beanie.operators import In
-from beanie import PydanticObjectId as ObjectId
+from beanie.operators import In, NotIn
+from bson import DBRef
+from beanie import Document, PydanticObjectId as ObjectId, UpdateResponse
+from cachetools import TTLCache
+from pymongo import ReturnDocument
 
 
 # Define logger
@@ -60,11 +69,38 @@ logger.setLevel(logging.DEBUG)
 # Define parent directory
 PARENT_DIRECTORY = Path(os.path.dirname(__file__)).parent
 
+# Default testsets of the app templates, keyed by template name, read once on import
+DEFAULT_TESTSETS_DIRECTORY = PARENT_DIRECTORY / "resources" / "default_testsets"
+
+
+def _load_default_testsets() -> Dict[str, Any]:
+    default_testsets = {}
+    for json_path in DEFAULT_TESTSETS_DIRECTORY.glob("*_testset.json"):
+        try:
+            default_testsets[json_path.name[: -len("_testset.json")]] = get_json(
+                str(json_path)
+            )
+        except Exception:
+            logger.exception(f"Failed to read the default testset {json_path.name}")
+    return default_testsets
+
+
+_default_testsets = _load_default_testsets()
+
+# Users looked up by uid, kept briefly since nearly every request looks one up
+_users_by_uid = TTLCache(maxsize=1024, ttl=60)
+
+# Fields that can be updated through update_evaluator_config and update_evaluation
+_EVALUATOR_CONFIG_FIELDS = frozenset(EvaluatorConfigDB.__fields__) - {"id"}
+_EVALUATION_FIELDS = frozenset(EvaluationDB.__fields__) - {"id"}
+
 
 async def add_testset_to_app_variant(
     app_id: str, org_id: str, template_name: str, app_name: str, **kwargs: dict
 ):
-    """Add testset to app variant.
+    """Add the default testset of the app template to the app variant, if the
+    template has one.
+
     Args:
         app_id (str): The id of the app
         org_id (str): The id of the organization
@@ -73,33 +109,24 @@ async def add_testset_to_app_variant(
         **kwargs (dict): Additional keyword arguments
     """
 
-    try:
-        app_db = await get_app_instance_by_id(app_id)
-        org_db = await get_organization_object(org_id)
-        user_db = await get_user(user_uid=kwargs["uid"])
-
-        json_path = os.path.join(
-            PARENT_DIRECTORY,
-            "resources",
-            "default_testsets",
-            f"{template_name}_testset.json",
-        )
-
-        if os.path.exists(json_path):
-            csvdata = get_json(json_path)
-            testset = {
-                "name": f"{app_name}_testset",
-                "app_name": app_name,
-                "created_at": datetime.now().isoformat(),
-                "csvdata": csvdata,
-            }
-            testset_db = TestSetDB(
-                **testset, app=app_db, user=user_db, organization=org_db
-            )
-            await testset_db.create()
+    csvdata = _default_testsets.get(template_name)
+    if csvdata is None:
+        logger.debug(f"No default testset for template {template_name}")
+        return
 
-    except Exception as e:
-        print(f"An error occurred in adding the default testset: {e}")
+    app_db, org_db, user_db = await asyncio.gather(
+        get_app_instance_by_id(app_id),
+        get_organization_object(org_id),
+        get_user(user_uid=kwargs["uid"]),
+    )
+    testset = {
+        "name": f"{app_name}_testset",
+        "app_name": app_name,
+        "created_at": datetime.now().isoformat(),
+        "csvdata": csvdata,
+    }
+    testset_db = TestSetDB(**testset, app=app_db, user=user_db, organization=org_db)
+    await testset_db.create()
 
 
 async def get_image(app_variant: AppVariant, **kwargs: dict) -> ImageExtended:
@@ -119,9 +146,11 @@ async def get_image(app_variant: AppVariant, **kwargs: dict) -> ImageExtended:
         AppVariantDB.organization.id == app_variant.organization,
     )
 
-    db_app_variant = await AppVariantDB.find_one(query_expression)
+    db_app_variant = await AppVariantDB.find_one(
+        *query_expression, projection_model=AppVariantImageView
+    )
     if db_app_variant:
-        image_db = await ImageDB.find_one(ImageDB.id == db_app_variant.image.id)
+        image_db = await ImageDB.get(db_app_variant.image.ref.id)
         return image_db_to_pydantic(image_db)
     else:
         raise Exception("App variant not found")
@@ -141,14 +170,17 @@ async def get_image_by_id(image_id: str) -> ImageDB:
     return image
 
 
-async def fetch_app_by_id(app_id: str, **kwargs: dict) -> AppDB:
+async def fetch_app_by_id(
+    app_id: str, fetch_links: bool = False, **kwargs: dict
+) -> AppDB:
     """Fetches an app by its ID.
 
     Args:
         app_id: _description_
+        fetch_links: whether to also fetch the linked documents
     """
     assert app_id is not None, "app_id cannot be None"
-    app = await AppDB.find_one(AppDB.id == ObjectId(app_id), fetch_links=True)
+    app = await AppDB.find_one(AppDB.id == ObjectId(app_id), fetch_links=fetch_links)
     return app
 
 
@@ -176,20 +208,21 @@ async def fetch_app_by_name(
 
 
 async def fetch_app_variant_by_id(
-    app_variant_id: str,
+    app_variant_id: str, fetch_links: bool = False
 ) -> Optional[AppVariantDB]:
     """
     Fetches an app variant by its ID.
 
     Args:
         app_variant_id (str): The ID of the app variant to fetch.
+        fetch_links (bool): Whether to also fetch the linked documents.
 
     Returns:
         AppVariantDB: The fetched app variant, or None if no app variant was found.
     """
     assert app_variant_id is not None, "app_variant_id cannot be None"
     app_variant = await AppVariantDB.find_one(
-        AppVariantDB.id == ObjectId(app_variant_id), fetch_links=True
+        AppVariantDB.id == ObjectId(app_variant_id), fetch_links=fetch_links
     )
     return app_variant
 
@@ -237,7 +270,7 @@ async def fetch_base_by_id(
     if base is None:
         logger.error("Base not found")
         return False
-    organization_id = base.organization.id
+    organization_id = base.organization.ref.id
     access = await check_user_org_access(
         user_org_data, str(organization_id), check_owner=False
     )
@@ -268,6 +301,49 @@ async def fetch_app_variant_by_name_and_appid(
     return app_variant_db
 
 
+async def fetch_variant_by_base_and_config_name(
+    base_id: str, config_name: str
+) -> Optional[AppVariantDB]:
+    """Fetch an app variant by its base id and config name.
+
+    Args:
+        base_id (str): The ID of the variant base
+        config_name (str): The name of the variant config
+
+    Returns:
+        AppVariantDB: the instance of the app variant, or None if not found
+    """
+
+    assert base_id is not None, "base_id cannot be None"
+    app_variant_db = await AppVariantDB.find_one(
+        AppVariantDB.base.id == ObjectId(base_id),
+        AppVariantDB.config_name == config_name,
+    )
+    return app_variant_db
+
+
+async def fetch_variants_by_base_and_config_names(
+    base_id: str, config_names: List[str]
+) -> List[AppVariantDB]:
+    """Fetch the app variants of a base matching any of the given config names,
+    in a single query.
+
+    Args:
+        base_id (str): The ID of the variant base
+        config_names (List[str]): The names of the variant configs
+
+    Returns:
+        List[AppVariantDB]: the instances of the app variants that were found
+    """
+
+    assert base_id is not None, "base_id cannot be None"
+    app_variants_db = await AppVariantDB.find(
+        AppVariantDB.base.id == ObjectId(base_id),
+        In(AppVariantDB.config_name, config_names),
+    ).to_list()
+    return app_variants_db
+
+
 async def create_new_variant_base(
     app: AppDB,
     organization: OrganizationDB,
@@ -336,7 +412,10 @@ async def create_new_app_variant(
     assert (
         parameters == {}
     ), "Parameters should be empty when calling create_new_app_variant (otherwise revision should not be set to 0)"
+    # the id is set upfront so that the revision can link to the variant before
+    # either is inserted, letting both inserts go out together
     variant = AppVariantDB(
+        id=ObjectId(),
         app=app,
         organization=organization,
         user=user,
@@ -350,9 +429,6 @@ async def create_new_app_variant(
         config_name=config_name,
         parameters=parameters,
     )
-
-    await variant.create()
-
     variant_revision = AppVariantRevisionsDB(
         variant=variant,
         revision=0,
@@ -360,7 +436,7 @@ async def create_new_app_variant(
         base=base,
         config=config,
     )
-    await variant_revision.create()
+    await asyncio.gather(variant.create(), variant_revision.create())
 
     return variant
 
@@ -473,19 +549,23 @@ async def create_app_and_envs(
         ValueError: If an app with the same name already exists.
     """
 
-    user_instance = await get_user(user_uid=user_org_data["uid"])
-    app = await fetch_app_by_name(app_name, organization_id, **user_org_data)
+    user_instance, app, organization_db = await asyncio.gather(
+        get_user(user_uid=user_org_data["uid"]),
+        fetch_app_by_name(app_name, organization_id, **user_org_data),
+        get_organization_object(organization_id),
+    )
     if app is not None:
         raise ValueError("App with the same name already exists")
 
-    organization_db = await get_organization_object(organization_id)
+    # the id is set upfront so that the environments can link to the app before
+    # it is inserted, letting all the inserts go out together
     app = AppDB(
+        id=ObjectId(),
         app_name=app_name,
         organization=organization_db,
         user=user_instance,
     )
-    await app.create()
-    await initialize_environments(app, **user_org_data)
+    await asyncio.gather(app.create(), initialize_environments(app, **user_org_data))
     return app
 
 
@@ -517,9 +597,7 @@ async def get_deployment_by_objectid(
         DeploymentDB: instance of deployment object
     """
 
-    deployment = await DeploymentDB.find_one(
-        DeploymentDB.id == ObjectId(deployment_id), fetch_links=True
-    )
+    deployment = await DeploymentDB.find_one(DeploymentDB.id == ObjectId(deployment_id))
     logger.debug(f"deployment: {deployment}")
     return deployment
 
@@ -534,9 +612,7 @@ async def get_deployment_by_appid(app_id: str) -> DeploymentDB:
         DeploymentDB: instance of deployment object
     """
 
-    deployment = await DeploymentDB.find_one(
-        DeploymentDB.app.id == ObjectId(app_id), fetch_links=True
-    )
+    deployment = await DeploymentDB.find_one(DeploymentDB.app.id == ObjectId(app_id))
     logger.debug(f"deployment: {deployment}")
     return deployment
 
@@ -586,7 +662,7 @@ async def list_app_variants_for_app_id(
     """
     assert app_id is not None, "app_id cannot be None"
     app_variants_db = await AppVariantDB.find(
-        AppVariantDB.app.id == ObjectId(app_id), fetch_links=True
+        AppVariantDB.app.id == ObjectId(app_id)
     ).to_list()
     return app_variants_db
 
@@ -624,15 +700,34 @@ async def list_variants_for_base(
     """
     assert base is not None, "base cannot be None"
     app_variants_db = (
-        await AppVariantDB.find(
-            AppVariantDB.base.id == ObjectId(base.id), fetch_links=True
-        )
+        await AppVariantDB.find(AppVariantDB.base.id == ObjectId(base.id))
         .sort("variant_name")
         .to_list()
     )
     return app_variants_db
 
 
+async def check_variant_config_name_exists(base_id: str, config_name: str) -> bool:
+    """
+    Checks whether the base already has an app variant with the given config name,
+    without loading the variant itself.
+
+    Args:
+        base_id (str): The ID of the base
+        config_name (str): The name of the variant config
+
+    Returns:
+        bool: True if such a variant exists, False otherwise
+    """
+    assert base_id is not None, "base_id cannot be None"
+    app_variant = await AppVariantDB.find_one(
+        AppVariantDB.base.id == ObjectId(base_id),
+        AppVariantDB.config_name == config_name,
+        projection_model=AppVariantConfigNameView,
+    )
+    return app_variant is not None
+
+
 async def get_user(user_uid: str) -> UserDB:
     """Get the user object from the database.
 
@@ -643,21 +738,79 @@ async def get_user(user_uid: str) -> UserDB:
         UserDB: instance of user
     """
 
-    user = await UserDB.find_one(UserDB.uid == user_uid)
+    user = await find_user_by_uid(user_uid)
     if user is None:
         if os.environ["FEATURE_FLAG"] not in ["cloud", "ee"]:
-            user_db = UserDB(uid="0")
-            user = await user_db.create()
+            # not cached here, as the default organization may still be being added
+            # by the request that created the user
+            user = await _get_or_create_default_user()
+        else:
+            raise Exception("Please login or signup")
+    return user
 
-            org_db = OrganizationDB(type="default", owner=str(user.id))
-            org = await org_db.create()
 
-            user_db.organizations.append(org.id)
-            await user_db.save()
+async def find_user_by_uid(user_uid: str) -> Optional[UserDB]:
+    """Find the user with the given uid, going through the short-lived user cache.
 
-            return user
-        raise Exception("Please login or signup")
-    return user
+    Unlike get_user, the default user is never created.
+
+    Arguments:
+        user_uid (str): The user unique identifier
+
+    Returns:
+        UserDB: instance of user, or None if no user has this uid
+    """
+
+    user = _users_by_uid.get(user_uid)
+    if user is None:
+        user = await UserDB.find_one(UserDB.uid == user_uid)
+        if user is None:
+            return None
+        _users_by_uid[user_uid] = user
+    # hand out copies so that callers never share a cached instance
+    return user.copy(deep=True)
+
+
+async def _get_or_create_default_user() -> UserDB:
+    """Gets the default user, creating it along with its default organization
+    when it does not exist yet.
+
+    The lookup and the creation happen in a single upsert, so concurrent requests
+    cannot create the default user twice.
+
+    Returns:
+        UserDB: instance of the default user
+    """
+
+    user_db = UserDB(id=ObjectId(), uid="0")
+    existing_user = await UserDB.get_motor_collection().find_one_and_update(
+        {"uid": user_db.uid},
+        {"$setOnInsert": {"_id": user_db.id, **user_db.dict(exclude={"id"})}},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+    if existing_user is not None:
+        return UserDB.parse_obj(existing_user)
+
+    # this request inserted the user, so it also creates the default organization
+    org_db = OrganizationDB(type="default", owner=str(user_db.id))
+    org = await org_db.create()
+    await UserDB.get_motor_collection().update_one(
+        {"_id": user_db.id}, {"$push": {"organizations": org.id}}
+    )
+    user_db.organizations.append(org.id)
+    invalidate_cached_user(user_db.uid)
+    return user_db
+
+
+def invalidate_cached_user(user_uid: str) -> None:
+    """Drops the cached user of the given uid, after it has been updated.
+
+    Arguments:
+        user_uid (str): The user unique identifier
+    """
+
+    _users_by_uid.pop(user_uid, None)
 
 
 async def get_user_with_id(user_id: ObjectId):
@@ -751,15 +904,11 @@ async def get_orga_image_instance_by_uri(
 
     Arguments:
         organization_id (str): The orga unique identifier
-        template_uri (url): The image template url
+        template_uri (url): The image template url, already validated by the caller
 
     Returns:
         ImageDB: instance of image object
     """
-    parsed_url = urlparse(template_uri)
-
-    if not parsed_url.scheme and not parsed_url.netloc:
-        raise ValueError(f"Invalid URL: {template_uri}")
 
     image = await ImageDB.find_one(
         ImageDB.template_uri == template_uri,
@@ -768,6 +917,9 @@ async def get_orga_image_instance_by_uri(
     return image
 
 
+# Apps are never updated once created, and removing one drops its entry, so a short-lived
+# copy is safe here. Generic lookups such as fetch_app_by_id always read the database.
+@async_ttl_cache()
 async def get_app_instance_by_id(app_id: str) -> AppDB:
     """Get the app object from the database with the provided id.
 
@@ -801,24 +953,25 @@ async def add_variant_from_base_and_config(
         AppVariantDB: The newly created app variant.
     """
     new_variant_name = f"{base_db.base_name}.{new_config_name}"
-    previous_app_variant_db = await find_previous_variant_from_base_id(str(base_db.id))
+    previous_app_variant_db, already_exists, user_db = await asyncio.gather(
+        find_previous_variant_from_base_id(str(base_db.id)),
+        check_variant_config_name_exists(str(base_db.id), new_config_name),
+        get_user(user_uid=user_org_data["uid"]),
+    )
     if previous_app_variant_db is None:
         logger.error("Failed to find the previous app variant in the database.")
         raise HTTPException(status_code=500, detail="Previous app variant not found")
     logger.debug(f"Located previous variant: {previous_app_variant_db}")
-    app_variant_for_base = await list_variants_for_base(base_db)
-
-    already_exists = any(
-        av for av in app_variant_for_base if av.config_name == new_config_name
-    )
     if already_exists:
         raise ValueError("App variant with the same name already exists")
-    user_db = await get_user(user_uid=user_org_data["uid"])
     config_db = ConfigDB(
         config_name=new_config_name,
         parameters=parameters,
     )
+    # the id is set upfront so that the revision can link to the variant before
+    # either is inserted, letting both inserts go out together
     db_app_variant = AppVariantDB(
+        id=ObjectId(),
         app=previous_app_variant_db.app,
         variant_name=new_variant_name,
         image=base_db.image,
@@ -834,7 +987,6 @@ async def add_variant_from_base_and_config(
         config=config_db,
         is_deleted=False,
     )
-    await db_app_variant.create()
     variant_revision = AppVariantRevisionsDB(
         variant=db_app_variant,
         revision=1,
@@ -842,17 +994,25 @@ async def add_variant_from_base_and_config(
         base=base_db,
         config=config_db,
     )
-    await variant_revision.create()
+    await asyncio.gather(db_app_variant.create(), variant_revision.create())
 
     return db_app_variant
 
 
 async def list_apps(
-    app_name: str = None, org_id: str = None, **user_org_data: dict
+    app_name: str = None,
+    org_id: str = None,
+    last_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    **user_org_data: dict,
 ) -> List[App]:
     """
     Lists all the unique app names and their IDs from the database
 
+    Args:
+        last_id: if specified, only returns the apps listed after the app with this id
+        limit: if specified, returns at most this many apps
+
     Errors:
         JSONResponse: You do not have permission to access this organization; status_code: 403
 
@@ -869,8 +1029,9 @@ async def list_apps(
     elif org_id is not None:
         organization_access = await check_user_org_access(user_org_data, org_id)
         if organization_access:
-            apps: List[AppDB] = await AppDB.find(
-                AppDB.organization.id == ObjectId(org_id)
+            apps_query = AppDB.find(AppDB.organization.id == ObjectId(org_id))
+            apps: List[AppDB] = await _paginate_by_id(
+                apps_query, AppDB, last_id, limit
             ).to_list()
             return [app_db_to_pydantic(app) for app in apps]
 
@@ -881,22 +1042,63 @@ async def list_apps(
             )
 
     else:
-        apps = await AppDB.find(AppDB.user.id == user.id).to_list()
+        apps_query = AppDB.find(AppDB.user.id == user.id)
+        apps = await _paginate_by_id(apps_query, AppDB, last_id, limit).to_list()
         return [app_db_to_pydantic(app) for app in apps]
 
 
-async def list_app_variants(app_id: str = None, **kwargs: dict) -> List[AppVariantDB]:
+def _paginate_by_id(
+    query, document_model, last_id: Optional[str], limit: Optional[int]
+):
+    """Restricts a find query to one page of documents, ordered by id.
+
+    Pages are keyed by the id of the last document of the previous page rather
+    than by an offset, so that every page is an index range scan.
+
+    Args:
+        query: the find query to paginate
+        document_model: the document class the query is on
+        last_id (Optional[str]): the id of the last document of the previous page
+        limit (Optional[int]): the maximum number of documents of the page
+
+    Returns:
+        the paginated query, or the query unchanged when neither is specified
+    """
+
+    if last_id is None and limit is None:
+        return query
+    if last_id is not None:
+        query = query.find(document_model.id > ObjectId(last_id))
+    query = query.sort(+document_model.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+async def list_app_variants(
+    app_id: str = None,
+    fetch_links: bool = False,
+    last_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    **kwargs: dict,
+) -> List[AppVariantDB]:
     """
     Lists all the app variants from the db
     Args:
         app_name: if specified, only returns the variants for the app name
+        fetch_links: whether to also fetch the linked documents of the variants
+        last_id: if specified, only returns the variants listed after the variant with this id
+        limit: if specified, returns at most this many variants
     Returns:
         List[AppVariant]: List of AppVariant objects
     """
 
     # Construct query expressions
-    app_variants_db = await AppVariantDB.find(
-        AppVariantDB.app.id == ObjectId(app_id), fetch_links=True
+    app_variants_query = AppVariantDB.find(
+        AppVariantDB.app.id == ObjectId(app_id), fetch_links=fetch_links
+    )
+    app_variants_db = await _paginate_by_id(
+        app_variants_query, AppVariantDB, last_id, limit
     ).to_list()
     return app_variants_db
 
@@ -913,10 +1115,14 @@ async def check_is_last_variant_for_image(db_app_variant: AppVariantDB) -> bool:
         true if it's the last variant, false otherwise
     """
 
-    count_variants = await AppVariantDB.find(
+    # counting stops at a second variant, which is enough to tell
+    variants_query = AppVariantDB.find(
         AppVariantDB.organization.id == db_app_variant.organization.id,
         AppVariantDB.base.id == db_app_variant.base.id,
-    ).count()
+    )
+    count_variants = await AppVariantDB.get_motor_collection().count_documents(
+        variants_query.get_filter_query(), limit=2
+    )
     return count_variants == 1
 
 
@@ -942,25 +1148,94 @@ async def remove_app_variant_from_db(app_variant_db: AppVariantDB, **kwargs: dic
     logger.debug("Removing app variant")
     assert app_variant_db is not None, "app_variant_db is missing"
 
-    # Remove the variant from the associated environments
-    logger.debug("list_environments_by_variant")
-    environments = await list_environments_by_variant(
-        app_variant_db,
-        **kwargs,
-    )
-    for environment in environments:
-        environment.deployed_app_variant = None
-        await environment.save()
+    # Remove the variant from the environments it is deployed to
+    logger.debug("remove_variant_from_environments")
+    await AppEnvironmentDB.find(
+        AppEnvironmentDB.deployed_app_variant == app_variant_db.id
+    ).update({"$set": {"deployed_app_variant": None}})
 
-    app_variant_revisions = await list_app_variant_revisions_by_variant(
-        app_variant_db, **kwargs
-    )
-    for app_variant_revision in app_variant_revisions:
-        await app_variant_revision.delete()
+    await AppVariantRevisionsDB.find(
+        AppVariantRevisionsDB.variant.id == app_variant_db.id
+    ).delete()
 
     await app_variant_db.delete()
 
 
+async def fetch_deploy_context(
+    variant_id: str, environment_name: str
+) -> Tuple[
+    Optional[AppVariantDB],
+    Optional[AppVariantRevisionsDB],
+    Optional[AppEnvironmentDB],
+    Optional[DeploymentDB],
+]:
+    """Fetch an app variant together with its current revision, the app environment
+    with the given name and the app deployment in a single query.
+
+    Args:
+        variant_id (str): The ID of the app variant
+        environment_name (str): The name of the app environment
+
+    Returns:
+        Tuple[AppVariantDB, AppVariantRevisionsDB, AppEnvironmentDB, DeploymentDB]: the
+            app variant, its current revision, the environment and the deployment,
+            any of which can be None
+    """
+
+    pipeline = [
+        {"$match": {"_id": ObjectId(variant_id)}},
+        {
+            "$lookup": {
+                "from": AppVariantRevisionsDB.get_collection_name(),
+                "localField": "_id",
+                "foreignField": "variant.$id",
+                "let": {"revision": "$revision"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$revision", "$$revision"]}}},
+                    {"$limit": 1},
+                ],
+                "as": "variant_revisions",
+            }
+        },
+        {
+            "$lookup": {
+                "from": AppEnvironmentDB.get_collection_name(),
+                "localField": "app.$id",
+                "foreignField": "app.$id",
+                "pipeline": [{"$match": {"name": environment_name}}, {"$limit": 1}],
+                "as": "environments",
+            }
+        },
+        {
+            "$lookup": {
+                "from": DeploymentDB.get_collection_name(),
+                "localField": "app.$id",
+                "foreignField": "app.$id",
+                "pipeline": [{"$limit": 1}],
+                "as": "deployments",
+            }
+        },
+    ]
+    results = await AppVariantDB.aggregate(pipeline).to_list(length=1)
+    if not results:
+        return None, None, None, None
+
+    app_variant_doc = results[0]
+    variant_revision_docs = app_variant_doc.pop("variant_revisions")
+    environment_docs = app_variant_doc.pop("environments")
+    deployment_docs = app_variant_doc.pop("deployments")
+    return (
+        AppVariantDB.parse_obj(app_variant_doc),
+        (
+            AppVariantRevisionsDB.parse_obj(variant_revision_docs[0])
+            if variant_revision_docs
+            else None
+        ),
+        AppEnvironmentDB.parse_obj(environment_docs[0]) if environment_docs else None,
+        DeploymentDB.parse_obj(deployment_docs[0]) if deployment_docs else None,
+    )
+
+
 async def deploy_to_environment(
     environment_name: str, variant_id: str, **user_org_data: dict
 ):
@@ -979,19 +1254,17 @@ async def deploy_to_environment(
         None
     """
 
-    app_variant_db = await fetch_app_variant_by_id(variant_id)
-    app_variant_revision_db = await fetch_app_variant_revision_by_variant(
-        app_variant_id=variant_id, revision=app_variant_db.revision
+    deploy_context, user = await asyncio.gather(
+        fetch_deploy_context(variant_id, environment_name),
+        get_user(user_uid=user_org_data["uid"]),
     )
+    app_variant_db, app_variant_revision_db, environment_db, deployment = deploy_context
     if app_variant_db is None:
         raise ValueError("App variant not found")
-
-    # Find the environment for the given app name and user
-    environment_db = await AppEnvironmentDB.find_one(
-        AppEnvironmentDB.app.id == app_variant_db.app.id,
-        AppEnvironmentDB.name == environment_name,
-    )
-
+    if app_variant_revision_db is None:
+        raise Exception(
+            f"app variant revision  for app_variant {variant_id} and revision {app_variant_db.revision} not found"
+        )
     if environment_db is None:
         raise ValueError(f"Environment {environment_name} not found")
     # TODO: Modify below to add logic to disable redployment of the same variant revision here and in frontend
@@ -1000,24 +1273,23 @@ async def deploy_to_environment(
     #         f"Variant {app_variant_db.app.app_name}/{app_variant_db.variant_name} is already deployed to the environment {environment_name}"
     #     )
 
-    # Retrieve app deployment
-    deployment = await get_deployment_by_appid(str(app_variant_db.app.id))
-
     # Update the environment with the new variant name
     environment_db.revision += 1
     environment_db.deployed_app_variant = app_variant_db.id
     environment_db.deployed_app_variant_revision = app_variant_revision_db
     environment_db.deployment = deployment.id
 
-    # Create revision for app environment
-    user = await get_user(user_uid=user_org_data["uid"])
-    await create_environment_revision(
-        environment_db,
-        user,
-        deployed_app_variant_revision=app_variant_revision_db.id,
-        deployment=deployment.id,
+    # Create revision for app environment, concurrently with saving the environment
+    # as they are written to different collections
+    await asyncio.gather(
+        create_environment_revision(
+            environment_db,
+            user,
+            deployed_app_variant_revision=app_variant_revision_db.id,
+            deployment=deployment.id,
+        ),
+        environment_db.save(),
     )
-    await environment_db.save()
 
 
 async def fetch_app_environment_by_name_and_appid(
@@ -1036,7 +1308,6 @@ async def fetch_app_environment_by_name_and_appid(
     app_environment = await AppEnvironmentDB.find_one(
         AppEnvironmentDB.app.id == ObjectId(app_id),
         AppEnvironmentDB.name == environment_name,
-        fetch_links=True,
     )
     return app_environment
 
@@ -1053,29 +1324,38 @@ async def fetch_app_variant_revision_by_id(
         AppVariantRevisionsDB: app variant revision object
     """
 
-    app_revision = await AppVariantRevisionsDB.find_one(
-        AppVariantRevisionsDB.id == ObjectId(variant_revision_id),
-    )
+    app_revision = await AppVariantRevisionsDB.get(ObjectId(variant_revision_id))
     return app_revision
 
 
 async def fetch_environment_revisions_for_environment(
-    environment: AppEnvironmentDB, **kwargs: dict
+    environment: AppEnvironmentDB,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    **kwargs: dict,
 ) -> List[AppEnvironmentRevisionDB]:
-    """Returns list of app environment revision for the given environment.
+    """Returns list of app environment revision for the given environment, newest first.
 
     Args:
         environment (AppEnvironmentDB): The app environment to retrieve environments revisions for.
+        skip (int): The number of most recent revisions to skip.
+        limit (Optional[int]): if specified, returns at most this many revisions
         **kwargs (dict): Additional keyword arguments.
 
     Returns:
         List[AppEnvironmentRevisionDB]: A list of AppEnvironmentRevisionDB objects.
     """
 
-    environment_revisions = await AppEnvironmentRevisionDB.find(
-        AppEnvironmentRevisionDB.environment.id == environment.id, fetch_links=True
-    ).to_list()
-    return environment_revisions
+    environment_revisions_query = (
+        AppEnvironmentRevisionDB.find(
+            AppEnvironmentRevisionDB.environment.id == environment.id
+        )
+        .sort(-AppEnvironmentRevisionDB.revision)
+        .skip(skip)
+    )
+    if limit is not None:
+        environment_revisions_query = environment_revisions_query.limit(limit)
+    return await environment_revisions_query.to_list()
 
 
 async def fetch_app_environment_revision(revision_id: str) -> AppEnvironmentRevisionDB:
@@ -1085,12 +1365,52 @@ async def fetch_app_environment_revision(revision_id: str) -> AppEnvironmentRevi
         revision_id (str): The ID of the revision
     """
 
-    environment_revision = await AppEnvironmentRevisionDB.find_one(
-        AppEnvironmentRevisionDB.id == ObjectId(revision_id), fetch_links=True
-    )
+    environment_revision = await AppEnvironmentRevisionDB.get(ObjectId(revision_id))
     return environment_revision
 
 
+async def fetch_environment_revision_with_variant(
+    revision_id: str,
+) -> Tuple[Optional[AppEnvironmentRevisionDB], Optional[AppVariantRevisionsDB]]:
+    """Fetch an app environment revision together with its deployed app variant
+    revision in a single query.
+
+    Args:
+        revision_id (str): The ID of the environment revision
+
+    Returns:
+        Tuple[AppEnvironmentRevisionDB, AppVariantRevisionsDB]: the environment revision
+            and its deployed app variant revision, either of which can be None
+    """
+
+    pipeline = [
+        {"$match": {"_id": ObjectId(revision_id)}},
+        {
+            "$lookup": {
+                "from": AppVariantRevisionsDB.get_collection_name(),
+                "localField": "deployed_app_variant_revision",
+                "foreignField": "_id",
+                "as": "deployed_app_variant_revisions",
+            }
+        },
+    ]
+    results = await AppEnvironmentRevisionDB.aggregate(pipeline).to_list(length=1)
+    if not results:
+        return None, None
+
+    environment_revision_doc = results[0]
+    variant_revision_docs = environment_revision_doc.pop(
+        "deployed_app_variant_revisions"
+    )
+    environment_revision = AppEnvironmentRevisionDB.parse_obj(environment_revision_doc)
+    variant_revision = (
+        AppVariantRevisionsDB.parse_obj(variant_revision_docs[0])
+        if variant_revision_docs
+        else None
+    )
+    return environment_revision, variant_revision
+
+
 async def update_app_environment(
     app_environment: AppEnvironmentDB, values_to_update: dict
 ):
@@ -1105,23 +1425,33 @@ async def update_app_environment(
 
 
 async def update_app_environment_deployed_variant_revision(
-    app_environment: AppEnvironmentDB, deployed_variant_revision: str
+    app_environment_id: str, deployed_variant_revision: str
 ):
     """Updates the deployed variant revision for an app environment
 
     Args:
-        app_environment (AppEnvironment): the app environment object
+        app_environment_id (str): the ID of the app environment
         deployed_variant_revision (str): the ID of the deployed variant revision
     """
 
-    app_variant_revision = await AppVariantRevisionsDB.find_one(
-        AppVariantRevisionsDB.id == ObjectId(deployed_variant_revision)
+    revision_id = ObjectId(deployed_variant_revision)
+    revision_count = await AppVariantRevisionsDB.get_motor_collection().count_documents(
+        {"_id": revision_id}, limit=1
     )
-    if app_variant_revision is None:
+    if not revision_count:
         raise Exception(f"App variant revision {deployed_variant_revision} not found")
 
-    app_environment.deployed_app_variant_revision = app_variant_revision
-    await app_environment.save()
+    await AppEnvironmentDB.find_one(
+        AppEnvironmentDB.id == ObjectId(app_environment_id)
+    ).update(
+        {
+            "$set": {
+                "deployed_app_variant_revision": DBRef(
+                    AppVariantRevisionsDB.get_collection_name(), revision_id
+                )
+            }
+        }
+    )
 
 
 async def list_environments(app_id: str, **kwargs: dict) -> List[AppEnvironmentDB]:
@@ -1142,7 +1472,7 @@ async def list_environments(app_id: str, **kwargs: dict) -> List[AppEnvironmentD
         raise ValueError("App not found")
 
     environments_db = await AppEnvironmentDB.find(
-        AppEnvironmentDB.app.id == ObjectId(app_id), fetch_links=True
+        AppEnvironmentDB.app.id == ObjectId(app_id)
     ).to_list()
     return environments_db
 
@@ -1160,10 +1490,19 @@ async def initialize_environments(
     Returns:
         List[AppEnvironmentDB]: A list of the initialized environments.
     """
-    environments = []
-    for env_name in ["development", "staging", "production"]:
-        env = await create_environment(name=env_name, app_db=app_db, **kwargs)
-        environments.append(env)
+    environments = [
+        AppEnvironmentDB(
+            id=ObjectId(),
+            app=app_db,
+            name=env_name,
+            user=app_db.user,
+            revision=0,
+            organization=app_db.organization,
+        )
+        for env_name in ["development", "staging", "production"]
+    ]
+    # the ids are set upfront since insert_many does not set them on the documents
+    await AppEnvironmentDB.insert_many(environments)
     return environments
 
 
@@ -1309,25 +1648,15 @@ async def remove_app_testsets(app_id: str, **kwargs):
         int: The number of testsets deleted
     """
 
-    # Get user object
-    # Find testsets owned by the app
-    deleted_count: int = 0
-
-    # Build query expression
-    testsets = await TestSetDB.find(
-        TestSetDB.app.id == ObjectId(app_id), fetch_links=True
-    ).to_list()
-
-    # Perform deletion if there are testsets to delete
-    if testsets is not None:
-        for testset in testsets:
-            await testset.delete()
-            deleted_count += 1
-            logger.info(f"{deleted_count} testset(s) deleted for app {app_id}")
-            return deleted_count
+    # Delete the testsets owned by the app in a single command
+    result = await TestSetDB.find(TestSetDB.app.id == ObjectId(app_id)).delete()
+    deleted_count: int = result.deleted_count if result is not None else 0
 
-    logger.info(f"No testsets found for app {app_id}")
-    return 0
+    if deleted_count:
+        logger.info(f"{deleted_count} testset(s) deleted for app {app_id}")
+    else:
+        logger.info(f"No testsets found for app {app_id}")
+    return deleted_count
 
 
 async def remove_base_from_db(base: VariantBaseDB, **kwargs):
@@ -1366,6 +1695,7 @@ async def remove_app_by_id(app_id: str, **kwargs):
     app_instance = await fetch_app_by_id(app_id=app_id)
     assert app_instance is not None, f"app instance for {app_id} could not be found"
     await app_instance.delete()
+    get_app_instance_by_id.cache.pop(str(app_id), None)
 
 
 async def update_variant_parameters(
@@ -1394,9 +1724,6 @@ async def update_variant_parameters(
         app_variant_db.revision = app_variant_db.revision + 1
         app_variant_db.modified_by = user
 
-        # Save updated ConfigDB
-        await app_variant_db.save()
-
         variant_revision = AppVariantRevisionsDB(
             variant=app_variant_db,
             revision=app_variant_db.revision,
@@ -1404,7 +1731,20 @@ async def update_variant_parameters(
             base=app_variant_db.base,
             config=config_db,
         )
-        await variant_revision.save()
+
+        # Save only the updated fields, alongside the insert of the new revision
+        await asyncio.gather(
+            AppVariantDB.find_one(AppVariantDB.id == app_variant_db.id).update(
+                {
+                    "$set": {
+                        "config.parameters": parameters,
+                        "revision": app_variant_db.revision,
+                        "modified_by": DBRef(UserDB.get_collection_name(), user.id),
+                    }
+                }
+            ),
+            variant_revision.create(),
+        )
 
     except Exception as e:
         logging.error(f"Issue updating variant parameters: {e}")
@@ -1446,6 +1786,51 @@ async def get_app_variant_revision_by_id(
     return variant_revision_db
 
 
+async def fetch_app_variants_by_ids(variant_ids: List[str]) -> Dict[str, AppVariantDB]:
+    """Get the app variant objects with the provided ids, in a single query.
+
+    Arguments:
+        variant_ids (List[str]): The app variant unique identifiers
+
+    Returns:
+        Dict[str, AppVariantDB]: the app variants found, by id
+    """
+
+    app_variants_db = await AppVariantDB.find(
+        In(AppVariantDB.id, list(map(ObjectId, variant_ids)))
+    ).to_list()
+    return {
+        str(app_variant_db.id): app_variant_db for app_variant_db in app_variants_db
+    }
+
+
+async def fetch_app_variant_revisions_by_ids(
+    variant_revision_ids: List[str],
+) -> Dict[str, AppVariantRevisionsDB]:
+    """Get the app variant revision objects with the provided ids, in a single query.
+
+    Arguments:
+        variant_revision_ids (List[str]): The app variant revision unique identifiers
+
+    Returns:
+        Dict[str, AppVariantRevisionsDB]: the app variant revisions found, by id
+    """
+
+    variant_revisions_db = await AppVariantRevisionsDB.find(
+        In(
+            AppVariantRevisionsDB.id,
+            [
+                ObjectId(variant_revision_id)
+                for variant_revision_id in variant_revision_ids
+            ],
+        )
+    ).to_list()
+    return {
+        str(variant_revision_db.id): variant_revision_db
+        for variant_revision_db in variant_revisions_db
+    }
+
+
 async def fetch_testset_by_id(testset_id: str) -> Optional[TestSetDB]:
     """Fetches a testset by its ID.
     Args:
@@ -1454,9 +1839,7 @@ async def fetch_testset_by_id(testset_id: str) -> Optional[TestSetDB]:
         TestSetDB: The fetched testset, or None if no testset was found.
     """
     assert testset_id is not None, "testset_id cannot be None"
-    testset = await TestSetDB.find_one(
-        TestSetDB.id == ObjectId(testset_id), fetch_links=True
-    )
+    testset = await TestSetDB.find_one(TestSetDB.id == ObjectId(testset_id))
     return testset
 
 
@@ -1472,32 +1855,50 @@ async def fetch_testsets_by_app_id(app_id: str) -> List[TestSetDB]:
     return testsets
 
 
-async def fetch_evaluation_by_id(evaluation_id: str) -> Optional[EvaluationDB]:
+async def list_testsets(app_id: str) -> List[TestSetView]:
+    """Lists the testsets of a given app, without loading their rows.
+    Args:
+        app_id (str): The ID of the app to list testsets for.
+    Returns:
+        List[TestSetView]: The id, name and creation date of the testsets.
+    """
+    assert app_id is not None, "app_id cannot be None"
+    testsets = await TestSetDB.find(
+        TestSetDB.app.id == ObjectId(app_id), projection_model=TestSetView
+    ).to_list()
+    return testsets
+
+
+async def fetch_evaluation_by_id(
+    evaluation_id: str, fetch_links: bool = False
+) -> Optional[EvaluationDB]:
     """Fetches a evaluation by its ID.
     Args:
         evaluation_id (str): The ID of the evaluation to fetch.
+        fetch_links (bool): Whether to also fetch the linked documents.
     Returns:
         EvaluationDB: The fetched evaluation, or None if no evaluation was found.
     """
     assert evaluation_id is not None, "evaluation_id cannot be None"
     evaluation = await EvaluationDB.find_one(
-        EvaluationDB.id == ObjectId(evaluation_id), fetch_links=True
+        EvaluationDB.id == ObjectId(evaluation_id), fetch_links=fetch_links
     )
     return evaluation
 
 
 async def fetch_human_evaluation_by_id(
-    evaluation_id: str,
+    evaluation_id: str, fetch_links: bool = False
 ) -> Optional[HumanEvaluationDB]:
     """Fetches a evaluation by its ID.
     Args:
         evaluation_id (str): The ID of the evaluation to fetch.
+        fetch_links (bool): Whether to also fetch the linked documents.
     Returns:
         EvaluationDB: The fetched evaluation, or None if no evaluation was found.
     """
     assert evaluation_id is not None, "evaluation_id cannot be None"
     evaluation = await HumanEvaluationDB.find_one(
-        HumanEvaluationDB.id == ObjectId(evaluation_id), fetch_links=True
+        HumanEvaluationDB.id == ObjectId(evaluation_id), fetch_links=fetch_links
     )
     return evaluation
 
@@ -1529,8 +1930,7 @@ async def fetch_human_evaluation_scenario_by_id(
     """
     assert evaluation_scenario_id is not None, "evaluation_scenario_id cannot be None"
     evaluation_scenario = await HumanEvaluationScenarioDB.find_one(
-        HumanEvaluationScenarioDB.id == ObjectId(evaluation_scenario_id),
-        fetch_links=True,
+        HumanEvaluationScenarioDB.id == ObjectId(evaluation_scenario_id)
     )
     return evaluation_scenario
 
@@ -1547,18 +1947,8 @@ async def find_previous_variant_from_base_id(
         Optional[AppVariantDB]: The previous variant, or None if no previous variant was found.
     """
     assert base_id is not None, "base_id cannot be None"
-    previous_variants = await AppVariantDB.find(
-        AppVariantDB.base.id == ObjectId(base_id)
-    ).to_list()
-    logger.debug("previous_variants: %s", previous_variants)
-    if len(list(previous_variants)) == 0:
-        return None
-    # select the variant for which previous_variant_name is None
-    for previous_variant in previous_variants:
-        # if previous_variant.previous_variant_name is None:
-        #     logger.debug("previous_variant: %s", previous_variant)
-        return previous_variant  # we don't care which variant do we return
-    assert False, "None of the previous variants has previous_variant_name=None"
+    # any variant of the base will do, so let the (base.$id, ...) index find the first one
+    return await AppVariantDB.find_one(AppVariantDB.base.id == ObjectId(base_id))
 
 
 async def add_template(**kwargs: dict) -> str:
@@ -1569,13 +1959,17 @@ async def add_template(**kwargs: dict) -> str:
         **kwargs (dict): Keyword arguments containing the template data.
 
     Returns:
-        template_id (Str): The Id of the created template.
+        template_id (Str): The Id of the created template, or None if a template with the same tag already exists.
     """
-    existing_template = await TemplateDB.find_one(TemplateDB.tag_id == kwargs["tag_id"])
-    if existing_template is None:
-        db_template = TemplateDB(**kwargs)
-        await db_template.create()
-        return str(db_template.id)
+    db_template = TemplateDB(**kwargs)
+    # inserts the template only if its tag is not there yet, in a single round trip
+    result = await TemplateDB.get_motor_collection().update_one(
+        {"tag_id": db_template.tag_id},
+        {"$setOnInsert": db_template.dict(exclude={"id", "revision_id"})},
+        upsert=True,
+    )
+    if result.upserted_id is not None:
+        return str(result.upserted_id)
 
 
 async def add_zip_template(key, value):
@@ -1589,7 +1983,9 @@ async def add_zip_template(key, value):
     Returns:
         template_id (Str): The Id of the created template.
     """
-    existing_template = await TemplateDB.find_one(TemplateDB.name == key)
+    existing_template = await TemplateDB.find_one(
+        TemplateDB.name == key, projection_model=TemplateView
+    )
 
     if existing_template:
         # Compare existing values with new values
@@ -1602,7 +1998,7 @@ async def add_zip_template(key, value):
             return str(existing_template.id)
         else:
             # Values are changed, delete existing template
-            await existing_template.delete()
+            await TemplateDB.find_one(TemplateDB.id == existing_template.id).delete()
 
     # Create a new template
     template_name = key
@@ -1644,15 +2040,7 @@ async def remove_old_template_from_db(tag_ids: list) -> None:
         tag_ids -- list of template IDs you want to keep
     """
 
-    templates_to_delete = []
-    templates: List[TemplateDB] = await TemplateDB.find().to_list()
-
-    for temp in templates:
-        if temp.tag_id not in tag_ids:
-            templates_to_delete.append(temp)
-
-    for template in templates_to_delete:
-        await template.delete()
+    await TemplateDB.find(NotIn(TemplateDB.tag_id, tag_ids)).delete()
 
 
 async def get_templates() -> List[Template]:
@@ -1662,7 +2050,7 @@ async def get_templates() -> List[Template]:
 
 async def count_apps(**user_org_data: dict) -> int:
     """
-    Counts all the unique app names from the database
+    Counts the distinct apps the user has created variants in
     """
 
     # Get user object
@@ -1670,9 +2058,35 @@ async def count_apps(**user_org_data: dict) -> int:
     if user is None:
         return 0
 
-    query_expressions = AppVariantDB.user.id == user.id
-    no_of_apps = await AppVariantDB.find(query_expressions).count()
-    return no_of_apps
+    # served from the (user.$id, app.$id) index, without loading the variants
+    app_ids = await AppVariantDB.get_motor_collection().distinct(
+        "app.$id", {"user.$id": user.id}
+    )
+    return len(app_ids)
+
+
+async def _set_document_fields(document: Document, **kwargs: dict) -> None:
+    """Sets the given fields of a document, both in memory and with a single $set in the database.
+
+    Keyword arguments that are not fields of the document, as well as its id, are ignored.
+
+    Arguments:
+        document (Document): The document to update.
+    """
+
+    document_model = type(document)
+    updates = {}
+    for key, value in kwargs.items():
+        if key not in document_model.__fields__ or key in ("id", "revision_id"):
+            continue
+        setattr(document, key, value)
+        # documents set on link fields are stored as references, as save() would
+        updates[key] = value.to_ref() if isinstance(value, Document) else value
+
+    if updates:
+        await document_model.find_one(document_model.id == document.id).update(
+            {"$set": updates}
+        )
 
 
 async def update_base(
@@ -1685,11 +2099,7 @@ async def update_base(
         base (VariantBaseDB): The base object to update.
     """
 
-    for key, value in kwargs.items():
-        if hasattr(base, key):
-            setattr(base, key, value)
-
-    await base.save()
+    await _set_document_fields(base, **kwargs)
     return base
 
 
@@ -1702,11 +2112,7 @@ async def update_app_variant(
     Arguments:
         app_variant (AppVariantDB): The app variant object to update.
     """
-    for key, value in kwargs.items():
-        if hasattr(app_variant, key):
-            setattr(app_variant, key, value)
-
-    await app_variant.save()
+    await _set_document_fields(app_variant, **kwargs)
     return app_variant
 
 
@@ -1730,13 +2136,11 @@ async def fetch_base_and_check_access(
     """
     if base_id is None:
         raise Exception("No base_id provided")
-    base = await VariantBaseDB.find_one(
-        VariantBaseDB.id == ObjectId(base_id), fetch_links=True
-    )
+    base = await VariantBaseDB.get(ObjectId(base_id))
     if base is None:
         logger.error("Base not found")
         raise HTTPException(status_code=404, detail="Base not found")
-    organization_id = base.organization.id
+    organization_id = base.organization.ref.id
     access = await check_user_org_access(
         user_org_data, str(organization_id), check_owner
     )
@@ -1763,13 +2167,13 @@ async def fetch_app_and_check_access(
     Raises:
         HTTPException: If the app is not found or the user does not have access to it.
     """
-    app = await AppDB.find_one(AppDB.id == ObjectId(app_id), fetch_links=True)
+    app = await AppDB.find_one(AppDB.id == ObjectId(app_id))
     if app is None:
         logger.error("App not found")
         raise HTTPException
 
     # Check user's access to the organization linked to the app.
-    organization_id = app.organization.id
+    organization_id = app.organization.ref.id
     access = await check_user_org_access(
         user_org_data, str(organization_id), check_owner
     )
@@ -1797,14 +2201,14 @@ async def fetch_app_variant_and_check_access(
         HTTPException: If the app variant is not found or the user does not have access to it.
     """
     app_variant = await AppVariantDB.find_one(
-        AppVariantDB.id == ObjectId(app_variant_id), fetch_links=True
+        AppVariantDB.id == ObjectId(app_variant_id)
     )
     if app_variant is None:
         logger.error("App variant not found")
         raise HTTPException
 
     # Check user's access to the organization linked to the app.
-    organization_id = app_variant.organization.id
+    organization_id = app_variant.organization.ref.id
     access = await check_user_org_access(
         user_org_data, str(organization_id), check_owner
     )
@@ -1847,6 +2251,7 @@ async def create_new_evaluation(
     Returns:
         EvaluationScenarioDB: The created evaluation scenario.
     """
+    now = datetime.now()
     evaluation = EvaluationDB(
         app=app,
         organization=organization,
@@ -1857,8 +2262,8 @@ async def create_new_evaluation(
         variant_revision=variant_revision,
         evaluators_configs=evaluators_configs,
         aggregated_results=[],
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        created_at=now,
+        updated_at=now,
     )
     await evaluation.create()
     return evaluation
@@ -1898,18 +2303,57 @@ async def create_new_evaluation_scenario(
     return evaluation_scenario
 
 
+async def create_new_evaluation_scenarios(
+    user: UserDB,
+    organization: OrganizationDB,
+    evaluation: EvaluationDB,
+    variant_id: str,
+    evaluators_configs: List[EvaluatorConfigDB],
+    scenarios: List[Dict[str, Any]],
+) -> List[EvaluationScenarioDB]:
+    """Create the evaluation scenarios of an evaluation in a single insert.
+
+    Args:
+        scenarios (List[Dict[str, Any]]): The inputs, outputs, correct_answer, is_pinned, note and results of each scenario.
+
+    Returns:
+        List[EvaluationScenarioDB]: The created evaluation scenarios.
+    """
+    evaluation_scenarios = [
+        EvaluationScenarioDB(
+            # insert_many does not set the ids on the documents
+            id=ObjectId(),
+            user=user,
+            organization=organization,
+            evaluation=evaluation,
+            variant_id=ObjectId(variant_id),
+            evaluators_configs=evaluators_configs,
+            **scenario,
+        )
+        for scenario in scenarios
+    ]
+    if evaluation_scenarios:
+        await EvaluationScenarioDB.insert_many(evaluation_scenarios, ordered=False)
+    return evaluation_scenarios
+
+
 async def update_evaluation_with_aggregated_results(
     evaluation_id: ObjectId, aggregated_results: List[AggregatedResult]
 ) -> EvaluationDB:
-    evaluation = await EvaluationDB.find_one(EvaluationDB.id == ObjectId(evaluation_id))
+    evaluation = await EvaluationDB.find_one(
+        EvaluationDB.id == ObjectId(evaluation_id)
+    ).update(
+        {
+            "$set": {
+                "aggregated_results": aggregated_results,
+                "updated_at": datetime.now(),
+            }
+        },
+        response_type=UpdateResponse.NEW_DOCUMENT,
+    )
 
     if not evaluation:
         raise ValueError("Evaluation not found")
-
-    evaluation.aggregated_results = aggregated_results
-    evaluation.updated_at = datetime.now().isoformat()
-
-    await evaluation.save()
     return evaluation
 
 
@@ -1921,13 +2365,10 @@ async def fetch_evaluators_configs(app_id: str):
     """
     assert app_id is not None, "evaluation_id cannot be None"
 
-    try:
-        evaluators_configs = await EvaluatorConfigDB.find(
-            EvaluatorConfigDB.app.id == ObjectId(app_id)
-        ).to_list()
-        return evaluators_configs
-    except Exception as e:
-        raise e
+    evaluators_configs = await EvaluatorConfigDB.find(
+        EvaluatorConfigDB.app.id == ObjectId(app_id)
+    ).to_list()
+    return evaluators_configs
 
 
 async def fetch_evaluator_config(evaluator_config_id: str):
@@ -1937,13 +2378,34 @@ async def fetch_evaluator_config(evaluator_config_id: str):
         EvaluatorConfigDB: the evaluator configuration object.
     """
 
-    try:
-        evaluator_config: EvaluatorConfigDB = await EvaluatorConfigDB.find_one(
-            EvaluatorConfigDB.id == ObjectId(evaluator_config_id)
-        )
-        return evaluator_config
-    except Exception as e:
-        raise e
+    evaluator_config: EvaluatorConfigDB = await EvaluatorConfigDB.find_one(
+        EvaluatorConfigDB.id == ObjectId(evaluator_config_id)
+    )
+    return evaluator_config
+
+
+async def fetch_evaluator_configs_by_ids(
+    evaluator_config_ids: List[str],
+    projection_model: Optional[Type[BaseModel]] = None,
+) -> Dict[str, EvaluatorConfigDB]:
+    """Fetch evaluator configurations with the provided ids, in a single query.
+
+    Args:
+        evaluator_config_ids (List[str]): The IDs of the evaluator configurations.
+        projection_model (Optional[Type[BaseModel]]): if specified, only loads the fields of this model, e.g. EvaluatorConfigView.
+
+    Returns:
+        Dict[str, EvaluatorConfigDB]: the evaluator configuration objects found, by id.
+    """
+
+    evaluator_configs = await EvaluatorConfigDB.find(
+        In(EvaluatorConfigDB.id, list(map(ObjectId, evaluator_config_ids))),
+        projection_model=projection_model,
+    ).to_list()
+    return {
+        str(evaluator_config.id): evaluator_config
+        for evaluator_config in evaluator_configs
+    }
 
 
 async def check_if_ai_critique_exists_in_list_of_evaluators_configs(
@@ -1955,21 +2417,17 @@ async def check_if_ai_critique_exists_in_list_of_evaluators_configs(
         EvaluatorConfigDB: the evaluator configuration object.
     """
 
-    try:
-        evaluator_configs_object_ids = [
-            ObjectId(evaluator_config_id)
-            for evaluator_config_id in evaluators_configs_ids
-        ]
-        evaluators_configs: List[EvaluatorConfigDB] = await EvaluatorConfigDB.find(
-            {
-                "_id": {"$in": evaluator_configs_object_ids},
-                "evaluator_key": "auto_ai_critique",
-            }
-        ).to_list()
+    evaluator_configs_object_ids = list(map(ObjectId, evaluators_configs_ids))
+    # counting stops at the first match, and no document is decoded
+    ai_critique_count = await EvaluatorConfigDB.get_motor_collection().count_documents(
+        {
+            "_id": {"$in": evaluator_configs_object_ids},
+            "evaluator_key": "auto_ai_critique",
+        },
+        limit=1,
+    )
 
-        return bool(evaluators_configs)
-    except Exception as e:
-        raise e
+    return ai_critique_count > 0
 
 
 async def fetch_evaluator_config_by_appId(
@@ -1985,14 +2443,11 @@ async def fetch_evaluator_config_by_appId(
         EvaluatorConfigDB: the evaluator configuration object.
     """
 
-    try:
-        evaluator_config = await EvaluatorConfigDB.find_one(
-            EvaluatorConfigDB.app.id == ObjectId(app_id),
-            EvaluatorConfigDB.evaluator_key == evaluator_name,
-        )
-        return evaluator_config
-    except Exception as e:
-        raise e
+    evaluator_config = await EvaluatorConfigDB.find_one(
+        EvaluatorConfigDB.app.id == ObjectId(app_id),
+        EvaluatorConfigDB.evaluator_key == evaluator_name,
+    )
+    return evaluator_config
 
 
 async def create_evaluator_config(
@@ -2014,11 +2469,8 @@ async def create_evaluator_config(
         settings_values=settings_values,
     )
 
-    try:
-        await new_evaluator_config.create()
-        return new_evaluator_config
-    except Exception as e:
-        raise e
+    await new_evaluator_config.create()
+    return new_evaluator_config
 
 
 async def update_evaluator_config(
@@ -2035,15 +2487,25 @@ async def update_evaluator_config(
         EvaluatorConfigDB: The updated evaluator configuration object.
     """
 
-    evaluator_config = await EvaluatorConfigDB.find_one(
+    updates_dict = {
+        key: value
+        for key, value in updates.dict(exclude_unset=True).items()
+        if key in _EVALUATOR_CONFIG_FIELDS
+    }
+    evaluator_config_query = EvaluatorConfigDB.find_one(
         EvaluatorConfigDB.id == ObjectId(evaluator_config_id)
     )
-    updates_dict = updates.dict(exclude_unset=True)
+    # mongodb rejects an empty $set
+    evaluator_config = (
+        await evaluator_config_query.update(
+            {"$set": updates_dict}, response_type=UpdateResponse.NEW_DOCUMENT
+        )
+        if updates_dict
+        else await evaluator_config_query
+    )
 
-    for key, value in updates_dict.items():
-        if hasattr(evaluator_config, key):
-            setattr(evaluator_config, key, value)
-    await evaluator_config.save()
+    if not evaluator_config:
+        raise ValueError("Evaluator config not found")
     return evaluator_config
 
 
@@ -2051,35 +2513,56 @@ async def delete_evaluator_config(evaluator_config_id: str) -> bool:
     """Delete an evaluator configuration from the database."""
     assert evaluator_config_id is not None, "Evaluator Config ID cannot be None"
 
-    try:
-        evaluator_config = await EvaluatorConfigDB.find_one(
-            EvaluatorConfigDB.id == ObjectId(evaluator_config_id)
-        )
-        delete_result = await evaluator_config.delete()
-        return delete_result.acknowledged
-    except Exception as e:
-        raise e
+    evaluator_config = await EvaluatorConfigDB.find_one(
+        EvaluatorConfigDB.id == ObjectId(evaluator_config_id)
+    )
+    delete_result = await evaluator_config.delete()
+    return delete_result.acknowledged
+
+
+async def delete_evaluator_configs(evaluators_configs_ids: List[str]) -> int:
+    """Delete evaluator configurations from the database.
+
+    Args:
+        evaluators_configs_ids (List[str]): The IDs of the evaluator configurations to delete.
+
+    Returns:
+        int: The number of deleted evaluator configurations.
+    """
+
+    evaluator_configs_object_ids = list(map(ObjectId, evaluators_configs_ids))
+    delete_result = await EvaluatorConfigDB.find(
+        In(EvaluatorConfigDB.id, evaluator_configs_object_ids)
+    ).delete()
+    return delete_result.deleted_count if delete_result else 0
 
 
 async def update_evaluation(
     evaluation_id: str, updates: Dict[str, Any]
 ) -> EvaluationDB:
     """
-    Update an evaluator configuration in the database with the provided id.
+    Update an evaluation in the database with the provided id.
 
     Arguments:
-        evaluation_id (str): The ID of the evaluator configuration to be updated.
-        updates (Dict[str, Any]): The updates to apply to the evaluator configuration.
+        evaluation_id (str): The ID of the evaluation to be updated.
+        updates (Dict[str, Any]): The updates to apply to the evaluation; keys that are not fields of the evaluation are ignored.
 
     Returns:
-        EvaluatorConfigDB: The updated evaluator configuration object.
+        EvaluationDB: The updated evaluation object.
     """
-    evaluation = await EvaluationDB.get(ObjectId(evaluation_id))
+    updates = {key: updates[key] for key in updates.keys() & _EVALUATION_FIELDS}
+    evaluation_query = EvaluationDB.find_one(EvaluationDB.id == ObjectId(evaluation_id))
+    # mongodb rejects an empty $set
+    evaluation = (
+        await evaluation_query.update(
+            {"$set": updates}, response_type=UpdateResponse.NEW_DOCUMENT
+        )
+        if updates
+        else await evaluation_query
+    )
 
-    for key, value in updates.items():
-        if hasattr(evaluation, key):
-            setattr(evaluation, key, value)
-    await evaluation.save()
+    if not evaluation:
+        raise ValueError("Evaluation not found")
     return evaluation
 
 
@@ -2091,7 +2574,8 @@ async def check_if_evaluation_contains_failed_evaluation_scenarios(
         {"results": {"$elemMatch": {"result.type": "error"}}},
     )
 
-    count = await query.count()
-    if count > 0:
-        return True
-    return False
+    # counting stops at the first failed scenario
+    failed_count = await EvaluationScenarioDB.get_motor_collection().count_documents(
+        query.get_filter_query(), limit=1
+    )
+    return failed_count > 0
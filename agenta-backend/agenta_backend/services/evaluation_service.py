@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Any
@@ -49,10 +50,12 @@ class UpdateEvaluationScenarioError(Exception):
 
 
 async def _fetch_evaluation_and_check_access(
-    evaluation_id: str, **user_org_data: dict
+    evaluation_id: str, fetch_links: bool = False, **user_org_data: dict
 ) -> EvaluationDB:
     # Fetch the evaluation by ID
-    evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id=evaluation_id)
+    evaluation = await db_manager.fetch_evaluation_by_id(
+        evaluation_id=evaluation_id, fetch_links=fetch_links
+    )
 
     # Check if the evaluation exists
     if evaluation is None:
@@ -62,23 +65,22 @@ async def _fetch_evaluation_and_check_access(
         )
 
     # Check for access rights
-    access = await check_access_to_app(
-        user_org_data=user_org_data, app_id=evaluation.app.id
-    )
+    app_id = evaluation.app.id if fetch_links else evaluation.app.ref.id
+    access = await check_access_to_app(user_org_data=user_org_data, app_id=app_id)
     if not access:
         raise HTTPException(
             status_code=403,
-            detail=f"You do not have access to this app: {str(evaluation.app.id)}",
+            detail=f"You do not have access to this app: {str(app_id)}",
         )
     return evaluation
 
 
 async def _fetch_human_evaluation_and_check_access(
-    evaluation_id: str, **user_org_data: dict
+    evaluation_id: str, fetch_links: bool = False, **user_org_data: dict
 ) -> HumanEvaluationDB:
     # Fetch the evaluation by ID
     evaluation = await db_manager.fetch_human_evaluation_by_id(
-        evaluation_id=evaluation_id
+        evaluation_id=evaluation_id, fetch_links=fetch_links
     )
 
     # Check if the evaluation exists
@@ -89,13 +91,12 @@ async def _fetch_human_evaluation_and_check_access(
         )
 
     # Check for access rights
-    access = await check_access_to_app(
-        user_org_data=user_org_data, app_id=evaluation.app.id
-    )
+    app_id = evaluation.app.id if fetch_links else evaluation.app.ref.id
+    access = await check_access_to_app(user_org_data=user_org_data, app_id=app_id)
     if not access:
         raise HTTPException(
             status_code=403,
-            detail=f"You do not have access to this app: {str(evaluation.app.id)}",
+            detail=f"You do not have access to this app: {str(app_id)}",
         )
     return evaluation
 
@@ -112,7 +113,9 @@ async def _fetch_human_evaluation_scenario_and_check_access(
             status_code=404,
             detail=f"Evaluation scenario with id {evaluation_scenario_id} not found",
         )
-    evaluation = evaluation_scenario.evaluation
+    evaluation = await db_manager.fetch_human_evaluation_by_id(
+        str(evaluation_scenario.evaluation.ref.id)
+    )
 
     # Check if the evaluation exists
     if evaluation is None:
@@ -123,12 +126,12 @@ async def _fetch_human_evaluation_scenario_and_check_access(
 
     # Check for access rights
     access = await check_access_to_app(
-        user_org_data=user_org_data, app_id=evaluation.app.id
+        user_org_data=user_org_data, app_id=evaluation.app.ref.id
     )
     if not access:
         raise HTTPException(
             status_code=403,
-            detail=f"You do not have access to this app: {str(evaluation.app.id)}",
+            detail=f"You do not have access to this app: {str(evaluation.app.ref.id)}",
         )
     return evaluation_scenario
 
@@ -488,10 +491,14 @@ async def fetch_list_evaluations(
     evaluations_db = await EvaluationDB.find(
         EvaluationDB.app.id == ObjectId(app_id), fetch_links=True
     ).to_list()
-    return [
-        await converters.evaluation_db_to_pydantic(evaluation)
-        for evaluation in evaluations_db
-    ]
+    # convert the evaluations concurrently so that their lookups are batched
+    loaders = converters.EvaluationLoaders()
+    return await asyncio.gather(
+        *[
+            converters.evaluation_db_to_pydantic(evaluation, loaders)
+            for evaluation in evaluations_db
+        ]
+    )
 
 
 async def fetch_evaluation(evaluation_id: str, **user_org_data: dict) -> Evaluation:
@@ -506,7 +513,7 @@ async def fetch_evaluation(evaluation_id: str, **user_org_data: dict) -> Evaluat
         Evaluation: The fetched evaluation.
     """
     evaluation = await _fetch_evaluation_and_check_access(
-        evaluation_id=evaluation_id, **user_org_data
+        evaluation_id=evaluation_id, fetch_links=True, **user_org_data
     )
     return await converters.evaluation_db_to_pydantic(evaluation)
 
@@ -535,10 +542,14 @@ async def fetch_list_human_evaluations(
     evaluations_db = await HumanEvaluationDB.find(
         HumanEvaluationDB.app.id == ObjectId(app_id), fetch_links=True
     ).to_list()
-    return [
-        await converters.human_evaluation_db_to_pydantic(evaluation)
-        for evaluation in evaluations_db
-    ]
+    # convert the evaluations concurrently so that their lookups are batched
+    loaders = converters.EvaluationLoaders()
+    return await asyncio.gather(
+        *[
+            converters.human_evaluation_db_to_pydantic(evaluation, loaders)
+            for evaluation in evaluations_db
+        ]
+    )
 
 
 async def fetch_human_evaluation(
@@ -555,7 +566,7 @@ async def fetch_human_evaluation(
         Evaluation: The fetched evaluation.
     """
     evaluation = await _fetch_human_evaluation_and_check_access(
-        evaluation_id=evaluation_id, **user_org_data
+        evaluation_id=evaluation_id, fetch_links=True, **user_org_data
     )
     return await converters.human_evaluation_db_to_pydantic(evaluation)
 
@@ -623,7 +634,7 @@ async def create_new_human_evaluation(
             detail=f"App with id {payload.app_id} does not exist",
         )
 
-    variants = [ObjectId(variant_id) for variant_id in payload.variant_ids]
+    variants = list(map(ObjectId, payload.variant_ids))
     variant_dbs = [
         await db_manager.fetch_app_variant_by_id(variant_id)
         for variant_id in payload.variant_ids
@@ -688,7 +699,7 @@ async def create_new_evaluation(
         Evaluation: The newly created evaluation.
     """
 
-    app = await db_manager.fetch_app_by_id(app_id=app_id)
+    app = await db_manager.fetch_app_by_id(app_id=app_id, fetch_links=True)
 
     testset = await db_manager.fetch_testset_by_id(testset_id)
     variant_db = await db_manager.get_app_variant_instance_by_id(variant_id)
@@ -726,12 +737,12 @@ async def retrieve_evaluation_results(
     # Check for access rights
     evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
     access = await check_access_to_app(
-        user_org_data=user_org_data, app_id=str(evaluation.app.id)
+        user_org_data=user_org_data, app_id=str(evaluation.app.ref.id)
     )
     if not access:
         raise HTTPException(
             status_code=403,
-            detail=f"You do not have access to this app: {str(evaluation.app.id)}",
+            detail=f"You do not have access to this app: {str(evaluation.app.ref.id)}",
         )
     return await converters.aggregated_result_to_pydantic(evaluation.aggregated_results)
 
@@ -740,7 +751,9 @@ async def compare_evaluations_scenarios(
     evaluations_ids: List[str],
     **user_org_data: dict,
 ):
-    evaluation = await db_manager.fetch_evaluation_by_id(evaluations_ids[0])
+    evaluation = await db_manager.fetch_evaluation_by_id(
+        evaluations_ids[0], fetch_links=True
+    )
     testset = evaluation.testset
     unique_testset_datapoints = remove_duplicates(testset.csvdata)
     formatted_inputs = extract_inputs_values_from_testset(unique_testset_datapoints)
@@ -821,7 +834,7 @@ def remove_duplicates(csvdata):
 
 
 async def fetch_evaluations_by_resource(resource_type: str, resource_ids: List[str]):
-    ids = list(map(lambda x: ObjectId(x), resource_ids))
+    ids = list(map(ObjectId, resource_ids))
     if resource_type == "variant":
         res = await EvaluationDB.find(In(EvaluationDB.variant, ids)).to_list()
     elif resource_type == "testset":
@@ -1,5 +1,7 @@
 import json
 import os
+import orjson
+from functools import lru_cache
 from typing import Any, Dict, Optional, List, Tuple
 
 from fastapi.responses import JSONResponse
@@ -11,6 +13,15 @@ from agenta_backend.models.db_models import AppDB, EvaluatorConfigDB
 from agenta_backend.models.api.evaluation_model import Evaluator, EvaluatorConfig
 from agenta_backend.models.converters import evaluator_config_db_to_pydantic
 from agenta_backend.resources.evaluators.evaluators import get_all_evaluators
+from agenta_backend.utils import redis_utils
+
+
+# Time to live of cached evaluator configurations
+EVALUATOR_CONFIG_CACHE_TTL_SECONDS = 300
+
+
+def _evaluator_config_cache_key(evaluator_config_id: str) -> str:
+    return f"evaluator_config:{evaluator_config_id}"
 
 
 def get_evaluators() -> Optional[List[Evaluator]]:
@@ -24,6 +35,23 @@ def get_evaluators() -> Optional[List[Evaluator]]:
     return get_all_evaluators()
 
 
+@lru_cache(maxsize=1)
+def get_evaluators_json() -> bytes:
+    """
+    Serializes the list of evaluators to JSON once and caches the result.
+
+    The evaluators are static, so the payload only needs to be validated and
+    serialized the first time it is requested.
+
+    Returns:
+        bytes: The JSON encoded list of evaluators.
+    """
+
+    return orjson.dumps(
+        [Evaluator(**evaluator).dict() for evaluator in get_evaluators()]
+    )
+
+
 async def get_evaluators_configs(app_id: str) -> List[EvaluatorConfig]:
     """
     Get evaluators configs by app_id.
@@ -51,8 +79,19 @@ async def get_evaluator_config(evaluator_config_id: str) -> EvaluatorConfig:
     Returns:
         EvaluatorConfig: The evaluator configuration object.
     """
+    cache_key = _evaluator_config_cache_key(evaluator_config_id)
+    cached_evaluator_config = await redis_utils.get_cached_response(cache_key)
+    if cached_evaluator_config is not None:
+        return EvaluatorConfig.parse_raw(cached_evaluator_config)
+
     evaluator_config_db = await db_manager.fetch_evaluator_config(evaluator_config_id)
-    return evaluator_config_db_to_pydantic(evaluator_config_db)
+    evaluator_config = evaluator_config_db_to_pydantic(evaluator_config_db)
+    await redis_utils.set_cached_response(
+        cache_key,
+        evaluator_config.json(),
+        ttl_seconds=EVALUATOR_CONFIG_CACHE_TTL_SECONDS,
+    )
+    return evaluator_config
 
 
 async def create_evaluator_config(
@@ -101,6 +140,9 @@ async def update_evaluator_config(
     evaluator_config = await db_manager.update_evaluator_config(
         evaluator_config_id, updates
     )
+    await redis_utils.invalidate_cached_response(
+        _evaluator_config_cache_key(evaluator_config_id)
+    )
     return evaluator_config_db_to_pydantic(evaluator_config=evaluator_config)
 
 
@@ -114,7 +156,32 @@ async def delete_evaluator_config(evaluator_config_id: str) -> bool:
     Returns:
         bool: True if the deletion was successful, False otherwise.
     """
-    return await db_manager.delete_evaluator_config(evaluator_config_id)
+    deleted = await db_manager.delete_evaluator_config(evaluator_config_id)
+    await redis_utils.invalidate_cached_response(
+        _evaluator_config_cache_key(evaluator_config_id)
+    )
+    return deleted
+
+
+async def delete_evaluator_configs(evaluators_configs_ids: List[str]) -> int:
+    """
+    Delete several evaluator configurations at once.
+
+    Args:
+        evaluators_configs_ids (List[str]): The IDs of the evaluator configurations to be deleted.
+
+    Returns:
+        int: The number of deleted evaluator configurations.
+    """
+    deleted_count = await db_manager.delete_evaluator_configs(evaluators_configs_ids)
+    if evaluators_configs_ids:
+        await redis_utils.invalidate_cached_response(
+            *[
+                _evaluator_config_cache_key(evaluator_config_id)
+                for evaluator_config_id in evaluators_configs_ids
+            ]
+        )
+    return deleted_count
 
 
 async def create_ready_to_use_evaluators(app: AppDB):
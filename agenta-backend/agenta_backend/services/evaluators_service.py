@@ -1,7 +1,11 @@
 import re
 import json
+import asyncio
 import httpx
-from typing import Any, Dict, Tuple
+import orjson
+from weakref import WeakKeyDictionary
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 from agenta_backend.services.security import sandbox
 from agenta_backend.models.db_models import Error, Result
@@ -15,6 +19,49 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    """Compiles a regex pattern once per evaluator config instead of once per scenario."""
+    return re.compile(pattern, flags)
+
+
+# httpx connections are bound to the event loop they were opened on, so a webhook
+# client is kept per loop, reusing its connections across evaluations
+_webhook_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_webhook_client() -> httpx.AsyncClient:
+    """Returns the webhook client of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _webhook_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=httpx.Timeout(10.0),
+        )
+        _webhook_clients[loop] = client
+    return client
+
+
+@lru_cache(maxsize=64)
+def _get_ai_critique_chain(
+    openai_api_key: str, prompt_template: str, input_variables: Tuple[str, ...]
+) -> LLMChain:
+    """Builds the AI critique chain once per api key, prompt template and inputs instead of once per scenario."""
+    llm = OpenAI(
+        openai_api_key=openai_api_key,
+        temperature=0.8,
+        model="gpt-3.5-turbo-instruct",
+    )
+    prompt = PromptTemplate(
+        input_variables=list(input_variables),
+        template=prompt_template,
+    )
+    return LLMChain(llm=llm, prompt=prompt)
+
+
 def auto_exact_match(
     inputs: Dict[str, Any],
     output: str,
@@ -23,18 +70,7 @@ def auto_exact_match(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
-    try:
-        exact_match = True if output == correct_answer else False
-        result = Result(type="bool", value=exact_match)
-        return result
-    except Exception as e:
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Auto Exact Match evaluation", stacktrace=str(e)
-            ),
-        )
+    return Result(type="bool", value=output == correct_answer)
 
 
 def auto_similarity_match(
@@ -46,18 +82,26 @@ def auto_similarity_match(
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
     try:
+        if not output or not correct_answer:
+            return Result(type="bool", value=False)
+        if output == correct_answer and not output.isspace():
+            # identical outputs with words have a similarity of 1, no need to split them
+            is_similar = 1 > settings_values["similarity_threshold"]
+            return Result(type="bool", value=is_similar)
+
         set1 = set(output.split())
         set2 = set(correct_answer.split())
-        intersect = set1.intersection(set2)
-        union = set1.union(set2)
+        if not set1 or not set2:
+            return Result(type="bool", value=False)
 
-        similarity = len(intersect) / len(union)
+        # the size of the union follows from the intersection, without building it
+        intersect_size = len(set1 & set2)
+        union_size = len(set1) + len(set2) - intersect_size
 
-        is_similar = (
-            True if similarity > settings_values["similarity_threshold"] else False
-        )
-        result = Result(type="bool", value=is_similar)
-        return result
+        similarity = intersect_size / union_size
+
+        is_similar = similarity > settings_values["similarity_threshold"]
+        return Result(type="bool", value=is_similar)
     except Exception as e:
         return Result(
             type="error",
@@ -78,7 +122,7 @@ def auto_regex_test(
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
     try:
-        re_pattern = re.compile(settings_values["regex_pattern"], re.IGNORECASE)
+        re_pattern = _compile_regex(settings_values["regex_pattern"], re.IGNORECASE)
         result = (
             bool(re_pattern.search(output)) == settings_values["regex_should_match"]
         )
@@ -102,15 +146,15 @@ def field_match_test(
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
     try:
-        output_json = json.loads(output)
+        output_json = orjson.loads(output)
         result = output_json[settings_values["json_field"]] == correct_answer
         return Result(type="bool", value=result)
     except Exception as e:
-        logging.debug("Field Match Test Failed because of Error: " + str(e))
+        logger.debug("Field Match Test Failed because of Error: %s", e)
         return Result(type="bool", value=False)
 
 
-def auto_webhook_test(
+async def auto_webhook_test(
     inputs: Dict[str, Any],
     output: str,
     correct_answer: str,
@@ -119,35 +163,35 @@ def auto_webhook_test(
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
     try:
-        with httpx.Client() as client:
-            webhook_body = settings_values.get("webhook_body", None)
-            if isinstance(webhook_body, str):
-                payload = json.loads(webhook_body)
-            if not webhook_body:
-                payload = {}
-            if isinstance(webhook_body, dict):
-                payload = webhook_body
-            response = client.post(url=settings_values["webhook_url"], json=payload)
-            response.raise_for_status()
-            response_data = response.json()
-            score = response_data.get("score", None)
-            if not score:
-                return Result(
-                    type="error",
-                    value=None,
-                    error=Error(
-                        message="Error during Auto Webhook evaluation; Webhook did not return a score",
-                    ),
-                )
-            if score < 0 or score > 1:
-                return Result(
-                    type="error",
-                    value=None,
-                    error=Error(
-                        message="Error during Auto Webhook evaluation; Webhook returned an invalid score. Score must be between 0 and 1",
-                    ),
-                )
-            return Result(type="number", value=score)
+        client = _get_webhook_client()
+        webhook_body = settings_values.get("webhook_body", None)
+        if isinstance(webhook_body, str):
+            payload = json.loads(webhook_body)
+        if not webhook_body:
+            payload = {}
+        if isinstance(webhook_body, dict):
+            payload = webhook_body
+        response = await client.post(url=settings_values["webhook_url"], json=payload)
+        response.raise_for_status()
+        response_data = orjson.loads(response.content)
+        score = response_data.get("score", None)
+        if not score:
+            return Result(
+                type="error",
+                value=None,
+                error=Error(
+                    message="Error during Auto Webhook evaluation; Webhook did not return a score",
+                ),
+            )
+        if score < 0 or score > 1:
+            return Result(
+                type="error",
+                value=None,
+                error=Error(
+                    message="Error during Auto Webhook evaluation; Webhook returned an invalid score. Score must be between 0 and 1",
+                ),
+            )
+        return Result(type="number", value=score)
     except httpx.HTTPError as e:
         return Result(
             type="error",
@@ -194,7 +238,7 @@ def auto_custom_code_run(
         )
 
 
-def auto_ai_critique(
+async def auto_ai_critique(
     inputs: Dict[str, Any],
     output: str,
     correct_answer: str,
@@ -217,12 +261,6 @@ def auto_ai_critique(
         str: Evaluation result.
     """
     try:
-        llm = OpenAI(
-            openai_api_key=lm_providers_keys["OPENAI_API_KEY"],
-            temperature=0.8,
-            model="gpt-3.5-turbo-instruct",
-        )
-
         chain_run_args = {
             "llm_app_prompt_template": app_params.get("prompt_user", ""),
             "variant_output": output,
@@ -232,15 +270,13 @@ def auto_ai_critique(
         for key, value in inputs.items():
             chain_run_args[key] = value
 
-        prompt = PromptTemplate(
-            input_variables=list(
-                chain_run_args.keys()
-            ),  # Use the keys from chain_run_args
-            template=settings_values["prompt_template"],
+        chain = _get_ai_critique_chain(
+            lm_providers_keys["OPENAI_API_KEY"],
+            settings_values["prompt_template"],
+            tuple(sorted(chain_run_args.keys())),  # Use the keys from chain_run_args
         )
-        chain = LLMChain(llm=llm, prompt=prompt)
 
-        evaluation_output = chain.run(**chain_run_args)
+        evaluation_output = await chain.arun(**chain_run_args)
 
         return Result(type="text", value=evaluation_output.strip())
     except Exception as e:
@@ -251,7 +287,23 @@ def auto_ai_critique(
         )
 
 
-def evaluate(
+# The evaluation functions, by evaluator key
+EVALUATORS: Dict[str, Callable[..., Any]] = {
+    "auto_exact_match": auto_exact_match,
+    "auto_similarity_match": auto_similarity_match,
+    "auto_regex_test": auto_regex_test,
+    "field_match_test": field_match_test,
+    "auto_webhook_test": auto_webhook_test,
+    "auto_custom_code_run": auto_custom_code_run,
+    "auto_ai_critique": auto_ai_critique,
+}
+
+# Evaluators that can block for long, since they run user-supplied code or regexes,
+# run in a worker thread so that they do not stall the other evaluations on the loop
+THREADED_EVALUATORS = frozenset({"auto_custom_code_run", "auto_regex_test"})
+
+
+async def evaluate(
     evaluator_key: str,
     inputs: Dict[str, Any],
     output: str,
@@ -260,19 +312,79 @@ def evaluate(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
-    evaluation_function = globals().get(evaluator_key, None)
-    if not evaluation_function:
-        raise ValueError(f"Evaluation method '{evaluator_key}' not found.")
+    evaluation_function = _get_evaluation_function(evaluator_key)
+    args = (
+        inputs,
+        output,
+        correct_answer,
+        app_params,
+        settings_values,
+        lm_providers_keys,
+    )
     try:
-        return evaluation_function(
-            inputs,
-            output,
-            correct_answer,
-            app_params,
-            settings_values,
-            lm_providers_keys,
-        )
+        if evaluator_key in THREADED_EVALUATORS:
+            return await asyncio.to_thread(evaluation_function, *args)
+        result = evaluation_function(*args)
+        # the evaluators waiting on the network (webhooks, AI critique) are coroutines
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
     except Exception as exc:
         raise RuntimeError(
             f"Error occurred while running {evaluator_key} evaluation. Exception: {str(exc)}"
         )
+
+
+async def evaluate_many(
+    evaluators: List[Tuple[str, Dict[str, Any]]],
+    inputs: Dict[str, Any],
+    output: str,
+    correct_answer: str,
+    app_params: Dict[str, Any],
+    lm_providers_keys: Dict[str, Any],
+) -> List[Result]:
+    """
+    Evaluates an output with several evaluators concurrently.
+
+    Args:
+        evaluators (List[Tuple[str, Dict[str, Any]]]): The key and settings values of each evaluator.
+
+    Returns:
+        List[Result]: The result of each evaluator, in order. An evaluator failing does not stop the others, its result is an error.
+
+    Raises:
+        ValueError: If one of the evaluators does not exist.
+    """
+    for evaluator_key, _ in evaluators:
+        _get_evaluation_function(evaluator_key)
+
+    results = await asyncio.gather(
+        *[
+            evaluate(
+                evaluator_key,
+                inputs,
+                output,
+                correct_answer,
+                app_params,
+                settings_values,
+                lm_providers_keys,
+            )
+            for evaluator_key, settings_values in evaluators
+        ],
+        return_exceptions=True,
+    )
+    return [
+        (
+            Result(type="error", value=None, error=Error(message=str(result)))
+            if isinstance(result, Exception)
+            else result
+        )
+        for result in results
+    ]
+
+
+def _get_evaluation_function(evaluator_key: str):
+    evaluation_function = EVALUATORS.get(evaluator_key)
+    if not evaluation_function:
+        raise ValueError(f"Evaluation method '{evaluator_key}' not found.")
+    return evaluation_function
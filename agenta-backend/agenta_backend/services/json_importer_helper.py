@@ -1,4 +1,4 @@
-import json
+import orjson
 
 
 def get_json(json_path: str):
@@ -9,9 +9,9 @@ def get_json(json_path: str):
                 json_path (str): The path of json
     """
 
-    with open(json_path) as f:
+    with open(json_path, "rb") as f:
         try:
-            json_data = json.loads(f.read())
+            json_data = orjson.loads(f.read())
         except Exception:
             raise ValueError(f"Could not read JSON file: {json_path}")
     return json_data
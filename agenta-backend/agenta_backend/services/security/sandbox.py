@@ -1,3 +1,5 @@
+from functools import lru_cache
+from types import CodeType
 from typing import Union, Text, Dict, Any
 
 from RestrictedPython import safe_builtins, compile_restricted, utility_builtins
@@ -28,6 +30,20 @@ def is_import_safe(python_code: Text) -> bool:
     return True
 
 
+@lru_cache(maxsize=128)
+def _compile_code(code: Text) -> CodeType:
+    """Compiles the code in a restricted environment, once per evaluator code.
+
+    Args:
+        code (Text): The Python code to be compiled
+
+    Returns:
+        CodeType - the compiled code, which is immutable and can be executed many times
+    """
+
+    return compile_restricted(code, filename="<inline>", mode="exec")
+
+
 def execute_code_safely(
     app_params: Dict[str, str],
     inputs: Dict[str, str],
@@ -84,7 +100,7 @@ def execute_code_safely(
     }
 
     # Compile the code in a restricted environment
-    byte_code = compile_restricted(code, filename="<inline>", mode="exec")
+    byte_code = _compile_code(code)
 
     # Execute the code
     exec(byte_code, environment)
@@ -1,4 +1,5 @@
 from agenta_backend.models.db_models import UserDB
+from agenta_backend.services.db_manager import invalidate_cached_user
 from agenta_backend.models.api.user_models import User, UserUpdate
 
 
@@ -18,6 +19,7 @@ async def update_user(user_uid: str, payload: UserUpdate) -> UserDB:
     if user is not None:
         values_to_update = {key: value for key, value in payload.dict()}
         await user.update({"$set": values_to_update})
+        invalidate_cached_user(user_uid)
         return user
     raise NotFound("Credentials not found. Please try again!")
 
@@ -3,7 +3,7 @@ import logging
 import os
 import re
 import traceback
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from agenta_backend.models.api.evaluation_model import (
     EvaluationStatusEnum,
@@ -15,6 +15,7 @@ from agenta_backend.models.db_models import (
     EvaluationScenarioInputDB,
     EvaluationScenarioOutputDB,
     EvaluationScenarioResult,
+    EvaluatorConfigView,
     InvokationResult,
     Error,
     Result,
@@ -26,11 +27,11 @@ from agenta_backend.services import (
     aggregation_service,
 )
 from agenta_backend.services.db_manager import (
-    create_new_evaluation_scenario,
+    create_new_evaluation_scenarios,
     fetch_app_by_id,
     fetch_app_variant_by_id,
     fetch_evaluation_by_id,
-    fetch_evaluator_config,
+    fetch_evaluator_configs_by_ids,
     fetch_testset_by_id,
     get_deployment_by_objectid,
     update_evaluation,
@@ -44,6 +45,9 @@ from celery import shared_task, states
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Maximum number of app outputs being evaluated at the same time
+MAX_CONCURRENT_EVALUATIONS = 20
+
 
 @shared_task(queue="agenta_backend.tasks.evaluations.evaluate", bind=True)
 def evaluate(
@@ -79,18 +83,32 @@ def evaluate(
         # 1. Fetch data from the database
         loop.run_until_complete(DBEngine().init_db())
         app = loop.run_until_complete(fetch_app_by_id(app_id))
-        app_variant_db = loop.run_until_complete(fetch_app_variant_by_id(variant_id))
+        app_variant_db = loop.run_until_complete(
+            fetch_app_variant_by_id(variant_id, fetch_links=True)
+        )
         app_variant_parameters = app_variant_db.config.parameters
         testset_db = loop.run_until_complete(fetch_testset_by_id(testset_id))
         new_evaluation_db = loop.run_until_complete(
             fetch_evaluation_by_id(evaluation_id)
         )
-        evaluator_config_dbs = []
-        for evaluator_config_id in evaluators_config_ids:
-            evaluator_config = loop.run_until_complete(
-                fetch_evaluator_config(evaluator_config_id)
+        evaluator_configs_by_id = loop.run_until_complete(
+            fetch_evaluator_configs_by_ids(
+                evaluators_config_ids, projection_model=EvaluatorConfigView
             )
-            evaluator_config_dbs.append(evaluator_config)
+        )
+        missing_evaluator_config_ids = [
+            evaluator_config_id
+            for evaluator_config_id in evaluators_config_ids
+            if evaluator_config_id not in evaluator_configs_by_id
+        ]
+        if missing_evaluator_config_ids:
+            raise ValueError(
+                f"Evaluator configs not found: {', '.join(missing_evaluator_config_ids)}"
+            )
+        evaluator_config_dbs = [
+            evaluator_configs_by_id[evaluator_config_id]
+            for evaluator_config_id in evaluators_config_ids
+        ]
         deployment_db = loop.run_until_complete(
             get_deployment_by_objectid(app_variant_db.base.deployment)
         )
@@ -120,6 +138,28 @@ def evaluate(
             llm_apps_service.get_parameters_from_openapi(uri + "/openapi.json")
         )
 
+        # The evaluators run on all the successful app outputs at once, so that the
+        # ones waiting on the network overlap; their results are consumed in order below
+        evaluation_results = iter(
+            loop.run_until_complete(
+                evaluate_app_outputs(
+                    [
+                        (data_point, app_output)
+                        for data_point, app_output in zip(
+                            testset_db.csvdata, app_outputs
+                        )
+                        if not app_output.result.error
+                    ],
+                    evaluator_config_dbs,
+                    correct_answer_column,
+                    app_variant_parameters,
+                    lm_providers_keys,
+                )
+            )
+        )
+
+        # the scenarios are saved together once all the data points are evaluated
+        evaluation_scenarios: List[Dict[str, Any]] = []
         for data_point, app_output in zip(testset_db.csvdata, app_outputs):
             # 1. We prepare the inputs
             logger.debug(f"Preparing inputs for data point: {data_point}")
@@ -164,13 +204,8 @@ def evaluate(
                     if correct_answer_column in data_point
                     else ""
                 )
-                loop.run_until_complete(
-                    create_new_evaluation_scenario(
-                        user=app.user,
-                        organization=app.organization,
-                        evaluation=new_evaluation_db,
-                        variant_id=variant_id,
-                        evaluators_configs=new_evaluation_db.evaluators_configs,
+                evaluation_scenarios.append(
+                    dict(
                         inputs=inputs,
                         is_pinned=False,
                         note="",
@@ -192,29 +227,11 @@ def evaluate(
                 )
                 continue
 
-            # 3. We evaluate
+            # 3. We collect the evaluation results
             evaluators_results: [EvaluationScenarioResult] = []
-            for evaluator_config_db in evaluator_config_dbs:
-                logger.debug(f"Evaluating with evaluator: {evaluator_config_db}")
-                if correct_answer_column in data_point:
-                    result = evaluators_service.evaluate(
-                        evaluator_key=evaluator_config_db.evaluator_key,
-                        output=app_output.result.value,
-                        correct_answer=data_point[correct_answer_column],
-                        settings_values=evaluator_config_db.settings_values,
-                        app_params=app_variant_parameters,
-                        inputs=data_point,
-                        lm_providers_keys=lm_providers_keys,
-                    )
-                else:
-                    result = Result(
-                        type="error",
-                        value=None,
-                        error=Error(
-                            message=f"No {correct_answer_column} column in test set"
-                        ),
-                    )
-
+            for evaluator_config_db, result in zip(
+                evaluator_config_dbs, next(evaluation_results)
+            ):
                 # Update evaluators aggregated data
                 evaluator_results: List[Result] = evaluators_aggregated_data[
                     str(evaluator_config_db.id)
@@ -228,19 +245,14 @@ def evaluate(
                 logger.debug(f"Result: {result_object}")
                 evaluators_results.append(result_object)
 
-            # 4. We save the result of the eval scenario in the db
+            # 4. We collect the result of the eval scenario
             correct_answer = (
                 data_point[correct_answer_column]
                 if correct_answer_column in data_point
                 else ""
             )
-            loop.run_until_complete(
-                create_new_evaluation_scenario(
-                    user=app.user,
-                    organization=app.organization,
-                    evaluation=new_evaluation_db,
-                    variant_id=variant_id,
-                    evaluators_configs=new_evaluation_db.evaluators_configs,
+            evaluation_scenarios.append(
+                dict(
                     inputs=inputs,
                     is_pinned=False,
                     note="",
@@ -254,6 +266,18 @@ def evaluate(
                 )
             )
 
+        # 5. We save the results of all the eval scenarios in the db
+        loop.run_until_complete(
+            create_new_evaluation_scenarios(
+                user=app.user,
+                organization=app.organization,
+                evaluation=new_evaluation_db,
+                variant_id=variant_id,
+                evaluators_configs=new_evaluation_db.evaluators_configs,
+                scenarios=evaluation_scenarios,
+            )
+        )
+
     except Exception as e:
         logger.error(f"An error occurred during evaluation: {e}")
         traceback.print_exc()
@@ -303,6 +327,58 @@ def evaluate(
     )
 
 
+async def evaluate_app_outputs(
+    data_points_outputs: List[Tuple[Dict[str, Any], InvokationResult]],
+    evaluator_config_dbs: List[EvaluatorConfigView],
+    correct_answer_column: str,
+    app_variant_parameters: Dict[str, Any],
+    lm_providers_keys: Dict[str, Any],
+) -> List[List[Result]]:
+    """
+    Evaluates the outputs of the app with every evaluator, evaluating at most
+    MAX_CONCURRENT_EVALUATIONS outputs at the same time.
+
+    Args:
+        data_points_outputs (List[Tuple[Dict[str, Any], InvokationResult]]): The data points with the app output for each of them.
+        evaluator_config_dbs (List[EvaluatorConfigView]): The evaluators configurations to evaluate with.
+        correct_answer_column (str): The name of the column in the testset that contains the correct answer.
+
+    Returns:
+        List[List[Result]]: For each data point, the results of the evaluators in order.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+    evaluators = [
+        (evaluator_config_db.evaluator_key, evaluator_config_db.settings_values)
+        for evaluator_config_db in evaluator_config_dbs
+    ]
+
+    async def evaluate_data_point(data_point, app_output) -> List[Result]:
+        if correct_answer_column not in data_point:
+            missing_column_result = Result(
+                type="error",
+                value=None,
+                error=Error(message=f"No {correct_answer_column} column in test set"),
+            )
+            return [missing_column_result] * len(evaluators)
+        async with semaphore:
+            logger.debug(f"Evaluating with evaluators: {evaluators}")
+            return await evaluators_service.evaluate_many(
+                evaluators=evaluators,
+                output=app_output.result.value,
+                correct_answer=data_point[correct_answer_column],
+                app_params=app_variant_parameters,
+                inputs=data_point,
+                lm_providers_keys=lm_providers_keys,
+            )
+
+    return await asyncio.gather(
+        *[
+            evaluate_data_point(data_point, app_output)
+            for data_point, app_output in data_points_outputs
+        ]
+    )
+
+
 async def aggregate_evaluator_results(
     app: AppDB, evaluators_aggregated_data: dict
 ) -> List[AggregatedResult]:
@@ -333,9 +409,8 @@ async def aggregate_evaluator_results(
         else:
             raise Exception(f"Evaluator {evaluator_key} aggregation does not exist")
 
-        evaluator_config = await fetch_evaluator_config(config_id)
         aggregated_result = AggregatedResult(
-            evaluator_config=evaluator_config.id,
+            evaluator_config=config_id,
             result=result,
         )
         aggregated_results.append(aggregated_result)
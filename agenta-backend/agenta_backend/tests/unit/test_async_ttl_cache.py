@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from agenta_backend.utils.common import async_ttl_cache
+
+
+class Document(BaseModel):
+    id: str
+    tags: list = []
+
+
+def make_fetcher(ttl=30):
+    calls = []
+
+    @async_ttl_cache(ttl=ttl)
+    async def fetch(document_id: str):
+        calls.append(document_id)
+        if document_id == "missing":
+            return None
+        return Document(id=document_id)
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_returns_copies():
+    fetch, calls = make_fetcher()
+
+    first = await fetch("1")
+    first.tags.append("changed")
+    second = await fetch("1")
+
+    assert calls == ["1"]
+    assert second is not first
+    assert second.tags == []
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_does_not_cache_missing_documents():
+    fetch, calls = make_fetcher()
+
+    assert await fetch("missing") is None
+    assert await fetch("missing") is None
+    assert calls == ["missing", "missing"]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_expires():
+    fetch, calls = make_fetcher(ttl=0.05)
+
+    await fetch("1")
+    await asyncio.sleep(0.1)
+    await fetch("1")
+
+    assert calls == ["1", "1"]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_pop_drops_the_entry():
+    fetch, calls = make_fetcher()
+
+    await fetch("1")
+    fetch.cache.pop("1", None)
+    await fetch("1")
+
+    assert calls == ["1", "1"]
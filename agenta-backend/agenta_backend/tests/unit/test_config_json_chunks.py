@@ -0,0 +1,50 @@
+import orjson
+
+from fastapi.responses import StreamingResponse
+
+from agenta_backend.models.api.api_models import GetConfigResponse
+from agenta_backend.routers import configs_router
+
+
+def serialize(config):
+    config_head = orjson.dumps(config.dict(exclude={"parameters"}))
+    parameters_fragments = [
+        orjson.dumps(key) + b":" + orjson.dumps(value)
+        for key, value in config.parameters.items()
+    ]
+    return list(
+        configs_router._iter_config_json_chunks(config_head, parameters_fragments)
+    )
+
+
+def make_config(parameters):
+    return GetConfigResponse(
+        config_name="default", current_version=1, parameters=parameters
+    )
+
+
+def test_iter_config_json_chunks_yields_the_whole_config():
+    parameters = {"temperature": 0.7, "prompt": 'say "hi"', "stop": ["\n"]}
+    config = make_config(parameters)
+
+    chunks = serialize(config)
+
+    assert len(chunks) == len(parameters) + 2
+    assert orjson.loads(b"".join(chunks)) == config.dict()
+
+
+def test_iter_config_json_chunks_without_parameters():
+    config = make_config({})
+
+    assert orjson.loads(b"".join(serialize(config))) == config.dict()
+
+
+def test_config_json_response_streams_large_parameters(monkeypatch):
+    config = make_config({"prompt": "x" * 100})
+
+    assert not isinstance(
+        configs_router.config_json_response(config), StreamingResponse
+    )
+
+    monkeypatch.setattr(configs_router, "STREAMING_PARAMETERS_THRESHOLD_BYTES", 10)
+    assert isinstance(configs_router.config_json_response(config), StreamingResponse)
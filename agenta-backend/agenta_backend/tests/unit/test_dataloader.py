@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from agenta_backend.utils.dataloader import DataLoader
+
+
+def make_loader(fail=False):
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(list(keys))
+        if fail:
+            raise RuntimeError("batch failed")
+        return {key: key * 10 for key in keys if key != 0}
+
+    return DataLoader(batch_load), batches
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_the_loads_of_one_loop_iteration():
+    loader, batches = make_loader()
+
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+
+    assert values == [10, 20, 30]
+    assert batches == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_memoizes_the_loaded_values():
+    loader, batches = make_loader()
+
+    first = await asyncio.gather(loader.load(1), loader.load(1))
+    second = await loader.load(1)
+    third = await asyncio.gather(loader.load(1), loader.load(2))
+
+    assert first == [10, 10]
+    assert second == 10
+    assert third == [10, 20]
+    assert batches == [[1], [2]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_loads_missing_keys_as_none():
+    loader, batches = make_loader()
+
+    values = await asyncio.gather(loader.load(0), loader.load(1))
+
+    assert values == [None, 10]
+    assert batches == [[0, 1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_sends_a_batch_error_to_every_waiter():
+    loader, batches = make_loader(fail=True)
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+
+    assert len(batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import pytest
+
+from agenta_backend.services import evaluators_service
+
+
+def run_evaluate_many(evaluators, output="hello world", correct_answer="hello world"):
+    return evaluators_service.evaluate_many(
+        evaluators,
+        inputs={},
+        output=output,
+        correct_answer=correct_answer,
+        app_params={},
+        lm_providers_keys={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_rejects_unknown_evaluators_up_front(monkeypatch):
+    calls = []
+
+    def recording_evaluator(*args):
+        calls.append(args)
+        return evaluators_service.Result(type="bool", value=True)
+
+    monkeypatch.setitem(evaluators_service.EVALUATORS, "recording", recording_evaluator)
+
+    with pytest.raises(ValueError):
+        await run_evaluate_many([("recording", {}), ("unknown_evaluator", {})])
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_turns_a_raising_evaluator_into_an_error_result(
+    monkeypatch,
+):
+    def raising_evaluator(*args):
+        raise KeyError("missing setting")
+
+    monkeypatch.setitem(evaluators_service.EVALUATORS, "raising", raising_evaluator)
+
+    results = await run_evaluate_many(
+        [("raising", {}), ("auto_exact_match", {})],
+    )
+
+    assert results[0].type == "error"
+    assert results[0].value is None
+    assert "raising" in results[0].error.message
+    assert results[1].type == "bool"
+    assert results[1].value is True
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_keeps_the_order_of_the_evaluators(monkeypatch):
+    async def slow_evaluator(*args):
+        await asyncio.sleep(0.05)
+        return evaluators_service.Result(type="text", value="slow")
+
+    async def fast_evaluator(*args):
+        return evaluators_service.Result(type="text", value="fast")
+
+    monkeypatch.setitem(evaluators_service.EVALUATORS, "slow", slow_evaluator)
+    monkeypatch.setitem(evaluators_service.EVALUATORS, "fast", fast_evaluator)
+
+    results = await run_evaluate_many([("slow", {}), ("fast", {}), ("slow", {})])
+
+    assert [result.value for result in results] == ["slow", "fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_runs_custom_code_outside_the_event_loop_thread(monkeypatch):
+    code = "def evaluate(app_params, inputs, correct_answer, output):\n    return 0.5\n"
+    loop_thread = threading.get_ident()
+    threads = []
+    original = evaluators_service.EVALUATORS["auto_custom_code_run"]
+
+    def recording_custom_code_run(*args):
+        threads.append(threading.get_ident())
+        return original(*args)
+
+    monkeypatch.setitem(
+        evaluators_service.EVALUATORS, "auto_custom_code_run", recording_custom_code_run
+    )
+    results = await run_evaluate_many([("auto_custom_code_run", {"code": code})])
+
+    assert results[0].type == "number"
+    assert results[0].value == 0.5
+    assert threads and threads[0] != loop_thread
@@ -3,6 +3,7 @@ import httpx
 import pytest
 import asyncio
 
+from agenta_backend.utils import redis_utils
 from agenta_backend.models.api.evaluation_model import EvaluationStatusEnum
 from agenta_backend.models.db_models import (
     AppDB,
@@ -12,6 +13,9 @@ from agenta_backend.models.db_models import (
     DeploymentDB,
     EvaluationScenarioDB,
 )
+from agenta_backend.services.evaluator_manager import _evaluator_config_cache_key
+
+from beanie import PydanticObjectId as ObjectId
 
 
 # Initialize http client
@@ -259,6 +263,74 @@ async def test_delete_evaluator_config():
     assert len(evaluator_configs) == count_of_deleted_configs
 
 
+@pytest.mark.asyncio
+async def test_delete_evaluator_configs(auto_exact_match_evaluator_config):
+    app = await AppDB.find_one(AppDB.app_name == APP_NAME)
+    payload = auto_exact_match_evaluator_config
+    payload["app_id"] = str(app.id)
+
+    evaluators_configs_ids = []
+    for _ in range(2):
+        response = await test_client.post(
+            f"{BACKEND_API_HOST}/evaluators/configs/", json=payload, timeout=timeout
+        )
+        evaluators_configs_ids.append(response.json()["id"])
+
+    response = await test_client.request(
+        "DELETE",
+        f"{BACKEND_API_HOST}/evaluators/configs/",
+        json={"evaluators_configs_ids": evaluators_configs_ids},
+        timeout=timeout,
+    )
+    assert response.status_code == 200
+    assert response.json() == len(evaluators_configs_ids)
+
+
+@pytest.mark.asyncio
+async def test_delete_evaluator_configs_drops_cached_configs(
+    auto_exact_match_evaluator_config,
+):
+    app = await AppDB.find_one(AppDB.app_name == APP_NAME)
+    payload = auto_exact_match_evaluator_config
+    payload["app_id"] = str(app.id)
+
+    response = await test_client.post(
+        f"{BACKEND_API_HOST}/evaluators/configs/", json=payload, timeout=timeout
+    )
+    evaluator_config_id = response.json()["id"]
+    cache_key = _evaluator_config_cache_key(evaluator_config_id)
+
+    # fetching the config caches it
+    response = await test_client.get(
+        f"{BACKEND_API_HOST}/evaluators/configs/{evaluator_config_id}/",
+        timeout=timeout,
+    )
+    assert response.status_code == 200
+    assert await redis_utils.get_cached_response(cache_key) is not None
+
+    response = await test_client.request(
+        "DELETE",
+        f"{BACKEND_API_HOST}/evaluators/configs/",
+        json={"evaluators_configs_ids": [evaluator_config_id]},
+        timeout=timeout,
+    )
+    assert response.status_code == 200
+    assert response.json() == 1
+    assert await redis_utils.get_cached_response(cache_key) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_evaluator_configs_with_unknown_ids():
+    response = await test_client.request(
+        "DELETE",
+        f"{BACKEND_API_HOST}/evaluators/configs/",
+        json={"evaluators_configs_ids": [str(ObjectId()), str(ObjectId())]},
+        timeout=timeout,
+    )
+    assert response.status_code == 200
+    assert response.json() == 0
+
+
 @pytest.mark.asyncio
 async def test_evaluation_scenario_match_evaluation_testset_length():
     evaluations = await EvaluationDB.find(
@@ -6,10 +6,9 @@ from agenta_backend.models.api.organization_models import OrganizationOutput
 
 import httpx
 import pytest
+import pytest_asyncio
 
 
-# Initialize http client
-test_client = httpx.AsyncClient()
 timeout = httpx.Timeout(timeout=5, read=None, write=5)
 
 # Set global variables
@@ -20,20 +19,27 @@ elif ENVIRONMENT == "github":
     BACKEND_API_HOST = "http://agenta-backend-test:8000"
 
 
+@pytest_asyncio.fixture(scope="module")
+async def async_client():
+    """Share one http client, and its connections to the backend, across the module."""
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
 @pytest.mark.asyncio
-async def test_list_organizations():
-    response = await test_client.get(f"{BACKEND_API_HOST}/organizations/")
+async def test_list_organizations(async_client):
+    response = await async_client.get(f"{BACKEND_API_HOST}/organizations/")
 
     assert response.status_code == 200
     assert len(response.json()) == 1
 
 
 @pytest.mark.asyncio
-async def test_get_user_organization():
+async def test_get_user_organization(async_client):
     user = await UserDB.find_one(UserDB.uid == "0")
     user_org = await selectors.get_user_own_org(user.uid)
 
-    response = await test_client.get(f"{BACKEND_API_HOST}/organizations/own/")
+    response = await async_client.get(f"{BACKEND_API_HOST}/organizations/own/")
 
     assert response.status_code == 200
     assert response.json() == OrganizationOutput(
@@ -1,6 +1,8 @@
 import logging
-from typing import Dict, List, Union, Optional, Any, Callable
+import functools
+from typing import Dict, List, Union, Optional, Any, Awaitable, Callable, TypeVar
 
+from cachetools import TTLCache
 from fastapi.types import DecoratedCallable
 from fastapi import APIRouter as FastAPIRouter
 
@@ -10,6 +12,7 @@ from agenta_backend.models.db_models import (
     OrganizationDB,
     AppDB,
     VariantBaseDB,
+    OrganizationLinkView,
 )
 
 from beanie import PydanticObjectId as ObjectId
@@ -18,6 +21,8 @@ from beanie import PydanticObjectId as ObjectId
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+DocumentT = TypeVar("DocumentT")
+
 
 class APIRouter(FastAPIRouter):
     """
@@ -60,6 +65,47 @@ class APIRouter(FastAPIRouter):
         return decorator
 
 
+def async_ttl_cache(
+    maxsize: int = 1024, ttl: int = 30
+) -> Callable[
+    [Callable[[str], Awaitable[Optional[DocumentT]]]],
+    Callable[[str], Awaitable[Optional[DocumentT]]],
+]:
+    """
+    Decorator caching the documents returned by an async fetcher taking a single id.
+
+    Found documents are kept in a per-process TTL cache keyed by the stringified id,
+    and callers always receive copies of them. The cache is exposed as the `cache`
+    attribute of the decorated function, so writers can drop stale entries with
+    `fetcher.cache.pop(str(id), None)`.
+
+    Parameters:
+    - maxsize (int): The maximum number of cached documents.
+    - ttl (int): The number of seconds a document is cached for.
+    """
+
+    def decorator(
+        func: Callable[[str], Awaitable[Optional[DocumentT]]]
+    ) -> Callable[[str], Awaitable[Optional[DocumentT]]]:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+        @functools.wraps(func)
+        async def wrapper(id_: str) -> Optional[DocumentT]:
+            key = str(id_)
+            document = cache.get(key)
+            if document is None:
+                document = await func(id_)
+                if document is None:
+                    return None
+                cache[key] = document
+            return document.copy(deep=True)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
 async def get_organization(org_id: str) -> OrganizationDB:
     org = await OrganizationDB.find_one(OrganizationDB.id == ObjectId(org_id))
     if org is not None:
@@ -124,15 +170,19 @@ async def check_access_to_app(
     if (app is None) == (app_id is None):
         raise Exception("Provide either app or app_id, not both or neither")
 
-    # Fetch the app if only app_id is provided.
+    # Fetch only the organization link of the app if only app_id is provided.
     if app is None:
-        app = await AppDB.find_one(AppDB.id == ObjectId(app_id), fetch_links=True)
-        if app is None:
+        app_view = await AppDB.find_one(
+            AppDB.id == ObjectId(app_id), projection_model=OrganizationLinkView
+        )
+        if app_view is None:
             logger.error("App not found")
             return False
+        organization_id = app_view.organization.ref.id
+    else:
+        organization_id = app.organization.id
 
     # Check user's access to the organization linked to the app.
-    organization_id = app.organization.id
     return await check_user_org_access(user_org_data, str(organization_id), check_owner)
 
 
@@ -144,12 +194,12 @@ async def check_access_to_variant(
     if variant_id is None:
         raise Exception("No variant_id provided")
     variant = await AppVariantDB.find_one(
-        AppVariantDB.id == ObjectId(variant_id), fetch_links=True
+        AppVariantDB.id == ObjectId(variant_id), projection_model=OrganizationLinkView
     )
     if variant is None:
         logger.error("Variant not found")
         return False
-    organization_id = variant.organization.id
+    organization_id = variant.organization.ref.id
     return await check_user_org_access(user_org_data, str(organization_id), check_owner)
 
 
@@ -160,9 +210,11 @@ async def check_access_to_base(
 ) -> bool:
     if base_id is None:
         raise Exception("No base_id provided")
-    base = await VariantBaseDB.find_one(VariantBaseDB.id == base_id, fetch_links=True)
+    base = await VariantBaseDB.find_one(
+        VariantBaseDB.id == base_id, projection_model=OrganizationLinkView
+    )
     if base is None:
         logger.error("Base not found")
         return False
-    organization_id = base.organization.id
+    organization_id = base.organization.ref.id
     return await check_user_org_access(user_org_data, str(organization_id), check_owner)
@@ -0,0 +1,64 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class DataLoader(Generic[KeyT, ValueT]):
+    """
+    Batches the loads requested during the same event loop iteration into a single
+    call of its batch load function, and memoizes the loaded values.
+
+    A loader memoizes values for its whole lifetime, so create one per request
+    rather than sharing it across requests.
+
+    Parameters:
+    - batch_load_fn (Callable[[List[KeyT]], Awaitable[Dict[KeyT, ValueT]]]): Loads the
+      values of several keys at once, returning them by key. Keys missing from the
+      returned dictionary load as None.
+    """
+
+    def __init__(
+        self, batch_load_fn: Callable[[List[KeyT]], Awaitable[Dict[KeyT, ValueT]]]
+    ):
+        self._batch_load_fn = batch_load_fn
+        self._futures: Dict[KeyT, asyncio.Future] = {}
+        self._pending_keys: List[KeyT] = []
+
+    def load(self, key: KeyT) -> Awaitable[Optional[ValueT]]:
+        """
+        Schedules the load of a key, batched with the other keys loaded in the same
+        event loop iteration.
+
+        Parameters:
+        - key (KeyT): The key to load.
+
+        Returns:
+        - Awaitable[Optional[ValueT]]: resolves to the loaded value, or None if not found.
+        """
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._pending_keys:
+                # runs once the coroutines already scheduled have queued their keys
+                loop.call_soon(self._dispatch)
+            self._pending_keys.append(key)
+        return future
+
+    def _dispatch(self) -> None:
+        keys, self._pending_keys = self._pending_keys, []
+        asyncio.ensure_future(self._load_batch(keys))
+
+    async def _load_batch(self, keys: List[KeyT]) -> None:
+        try:
+            values = await self._batch_load_fn(keys)
+        except Exception as e:
+            for key in keys:
+                self._futures.pop(key).set_exception(e)
+            return
+        for key in keys:
+            self._futures[key].set_result(values.get(key))
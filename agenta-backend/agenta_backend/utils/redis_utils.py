@@ -1,6 +1,17 @@
 import os
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
 import redis
-from redis.exceptions import ConnectionError
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, RedisError
+
+
+logger = logging.getLogger(__name__)
+
+# Shared asyncio client, created on first use
+_async_redis_client: Optional[aioredis.Redis] = None
 
 
 def redis_connection() -> redis.Redis:
@@ -19,3 +30,109 @@ def redis_connection() -> redis.Redis:
     except ConnectionError:
         raise ConnectionError("Could not connect to redis service.")
     return redis_client
+
+
+def async_redis_connection() -> Optional[aioredis.Redis]:
+    """Returns a shared asyncio client object for connecting to the Redis service \
+        specified by the REDIS_URL environment variable.
+
+    :return: an asyncio Redis client object, or None if REDIS_URL is missing or invalid.
+    """
+
+    global _async_redis_client
+    if _async_redis_client is None:
+        redis_url = os.environ.get("REDIS_URL")
+        if not redis_url:
+            logger.warning("REDIS_URL is not set, running without redis")
+            return None
+        try:
+            _async_redis_client = aioredis.from_url(url=redis_url)
+        except ValueError as e:
+            logger.warning(f"Invalid REDIS_URL, running without redis: {e}")
+            return None
+    return _async_redis_client
+
+
+async def get_cached_response(key: str) -> Optional[bytes]:
+    """Returns the cached response stored under the given key, if any.
+
+    Cache errors are logged and treated as a cache miss.
+
+    :param key: the cache key.
+    :return: the cached bytes, or None.
+    """
+
+    redis_client = async_redis_connection()
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except RedisError as e:
+        logger.warning(f"Failed to read {key} from cache: {e}")
+        return None
+
+
+async def set_cached_response(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Caches a response under the given key for ttl_seconds.
+
+    :param key: the cache key.
+    :param value: the serialized response.
+    :param ttl_seconds: the time to live of the cache entry.
+    """
+
+    redis_client = async_redis_connection()
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, value, ex=ttl_seconds)
+    except RedisError as e:
+        logger.warning(f"Failed to write {key} to cache: {e}")
+
+
+async def invalidate_cached_response(*keys: str) -> None:
+    """Removes the cached responses stored under the given keys.
+
+    :param keys: the cache keys.
+    """
+
+    redis_client = async_redis_connection()
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate {keys} in cache: {e}")
+
+
+@asynccontextmanager
+async def redis_lock(name: str, timeout_seconds: int = 10) -> AsyncIterator[None]:
+    """Holds a Redis lock, shared by all workers, for the duration of the block.
+
+    When Redis is unavailable or the lock cannot be acquired within
+    timeout_seconds, the block runs without the lock.
+
+    :param name: the name of the lock.
+    :param timeout_seconds: how long to wait for, and to hold, the lock.
+    """
+
+    redis_client = async_redis_connection()
+    acquired = False
+    if redis_client is not None:
+        lock = redis_client.lock(
+            f"lock:{name}", timeout=timeout_seconds, blocking_timeout=timeout_seconds
+        )
+        try:
+            acquired = await lock.acquire()
+        except RedisError as e:
+            logger.warning(f"Failed to acquire lock {name}: {e}")
+    if not acquired:
+        logger.warning(f"Running without lock {name}")
+
+    try:
+        yield
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except RedisError as e:
+                logger.warning(f"Failed to release lock {name}: {e}")